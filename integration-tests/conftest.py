@@ -1,8 +1,10 @@
 import pytest
+import pytest_asyncio
 import asyncio
 import threading
 import time
 import uvicorn
+from aiohttp import ClientSession, TCPConnector
 from app.main import app
 
 
@@ -106,3 +108,15 @@ def running_server():
     yield server
     server.stop()
 
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client_session(running_server):
+    """
+    Session-scoped HTTP client bound to the running server.
+    Keep-alive connections are pooled across tests.
+    """
+    async with ClientSession(
+        base_url=running_server.base_url,
+        connector=TCPConnector(limit=100, keepalive_timeout=30)
+    ) as session:
+        yield session
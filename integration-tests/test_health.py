@@ -1,11 +1,9 @@
 import pytest
-from aiohttp import ClientSession
 
 @pytest.mark.asyncio
-async def test_health_endpoint(running_server):
-    """Test using the session-scoped server (shared across tests)."""
-    async with ClientSession() as session:
-        async with session.get(f"{running_server.base_url}/health") as response:
-            assert response.status == 200
-            data = await response.json()
-            assert data["message"] == "OK"
\ No newline at end of file
+async def test_health_endpoint(client_session):
+    """Test using the session-scoped server and client (shared across tests)."""
+    async with client_session.get("/health") as response:
+        assert response.status == 200
+        data = await response.json()
+        assert data["message"] == "OK"
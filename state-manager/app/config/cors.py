@@ -4,44 +4,53 @@ CORS configuration for the State Manager API
 import os
 from typing import List
 
+# Default origins for development
+DEFAULT_ORIGINS = (
+    "http://localhost:3000",  # Next.js frontend
+    "http://localhost:3001",  # Alternative frontend port
+    "http://127.0.0.1:3000",  # Alternative localhost
+    "http://127.0.0.1:3001",  # Alternative localhost port
+)
+
+ALLOW_METHODS = ("GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH")
+
+ALLOW_HEADERS = (
+    "Accept",
+    "Accept-Language",
+    "Content-Language",
+    "Content-Type",
+    "X-API-Key",
+    "Authorization",
+    "X-Requested-With",
+    "X-Exosphere-Request-ID",
+)
+
+EXPOSE_HEADERS = (
+    "X-Exosphere-Request-ID",
+)
+
 def get_cors_origins() -> List[str]:
     """
     Get CORS origins from environment variables or use defaults
     """
     # Get origins from environment variable
     cors_origins = os.getenv("CORS_ORIGINS", "")
-    
+
     if cors_origins:
-        # Split by comma and strip whitespace
-        return [origin.strip() for origin in cors_origins.split(",") if origin.strip()]
-    
-    # Default origins for development
-    return [
-        "http://localhost:3000",  # Next.js frontend
-        "http://localhost:3001",  # Alternative frontend port
-        "http://127.0.0.1:3000",  # Alternative localhost
-        "http://127.0.0.1:3001",  # Alternative localhost port
-    ]
+        # Split by comma and strip whitespace, dropping empty entries
+        return [origin for origin in (entry.strip() for entry in cors_origins.split(",")) if origin]
+
+    return list(DEFAULT_ORIGINS)
 
 def get_cors_config():
     """
     Get CORS configuration
     """
+    # Fresh lists on every call so callers can't mutate the shared defaults
     return {
         "allow_origins": get_cors_origins(),
         "allow_credentials": True,
-        "allow_methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
-        "allow_headers": [
-            "Accept",
-            "Accept-Language",
-            "Content-Language",
-            "Content-Type",
-            "X-API-Key",
-            "Authorization",
-            "X-Requested-With",
-            "X-Exosphere-Request-ID",
-        ],
-        "expose_headers": [  
-            "X-Exosphere-Request-ID",  
-        ],
+        "allow_methods": list(ALLOW_METHODS),
+        "allow_headers": list(ALLOW_HEADERS),
+        "expose_headers": list(EXPOSE_HEADERS),
     }
@@ -1,5 +1,6 @@
 import asyncio
 import time
+from typing import Any
 
 from ..models.enqueue_request import EnqueueRequestModel
 from ..models.enqueue_response import EnqueueResponseModel, StateModel
@@ -11,8 +12,14 @@ from pymongo import ReturnDocument
 
 logger = LogsManager().get_logger()
 
+# Only the fields the enqueue response is built from
+ENQUEUE_PROJECTION = {"_id": 1, "node_name": 1, "identifier": 1, "inputs": 1, "created_at": 1}
 
-async def find_state(namespace_name: str, nodes: list[str]) -> State | None:
+# The claim update has no per-call parts, so one dict is shared by every claim
+ENQUEUE_UPDATE = {"$set": {"status": StateStatusEnum.QUEUED}}
+
+
+async def find_state(namespace_name: str, nodes: list[str]) -> dict[str, Any] | None:
     data = await State.get_pymongo_collection().find_one_and_update(
         {
             "namespace_name": namespace_name,
@@ -22,18 +29,21 @@ async def find_state(namespace_name: str, nodes: list[str]) -> State | None:
             },
             "enqueue_after": {"$lte": int(time.time() * 1000)}
         },
-        {
-            "$set": {"status": StateStatusEnum.QUEUED}
-        },
+        ENQUEUE_UPDATE,
+        projection=ENQUEUE_PROJECTION,
         return_document=ReturnDocument.AFTER
     )
-    return State(**data) if data else None
+    return data
 
 async def enqueue_states(namespace_name: str, body: EnqueueRequestModel, x_exosphere_request_id: str) -> EnqueueResponseModel:
     
     try:
         logger.info(f"Enqueuing states for namespace {namespace_name}", x_exosphere_request_id=x_exosphere_request_id)
 
+        # Nothing can match, skip the database round trips
+        if not body.nodes or body.batch_size <= 0:
+            return EnqueueResponseModel(count=0, namespace=namespace_name, status=StateStatusEnum.QUEUED, states=[])
+
         # Create tasks for parallel execution
         tasks = [find_state(namespace_name, body.nodes) for _ in range(body.batch_size)]
         results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -53,11 +63,11 @@ async def enqueue_states(namespace_name: str, body: EnqueueRequestModel, x_exosp
             status=StateStatusEnum.QUEUED,
             states=[
                 StateModel(
-                    state_id=str(state.id),
-                    node_name=state.node_name,
-                    identifier=state.identifier,
-                    inputs=state.inputs,
-                    created_at=state.created_at
+                    state_id=str(state["_id"]),
+                    node_name=state["node_name"],
+                    identifier=state["identifier"],
+                    inputs=state["inputs"],
+                    created_at=state["created_at"]
                 )
                 for state in states
             ]
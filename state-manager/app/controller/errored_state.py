@@ -1,4 +1,5 @@
 import time
+from datetime import datetime
 
 from app.models.errored_models import ErroredRequestModel, ErroredResponseModel
 from fastapi import HTTPException, status
@@ -35,9 +36,25 @@ async def errored_state(namespace_name: str, state_id: PydanticObjectId, body: E
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Graph template not found")
             raise e
 
-        retry_created = False
+        retry_created = state.retry_count < graph_template.retry_policy.max_retries
+        new_status = StateStatusEnum.RETRY_CREATED if retry_created else StateStatusEnum.ERRORED
 
-        if state.retry_count < graph_template.retry_policy.max_retries:
+        # Claim the transition before creating the retry, so a state that moved on concurrently never gets one
+        collection = State.get_pymongo_collection()
+        result = await collection.update_one(
+            {"_id": state.id, "status": StateStatusEnum.QUEUED},
+            {"$set": {"status": new_status, "error": body.error, "updated_at": datetime.now()}}
+        )
+        if result.matched_count == 0:
+            # Only the status is needed to report why the update missed
+            current = await collection.find_one({"_id": state.id}, {"status": 1})
+            if not current:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="State not found")
+            if current["status"] == StateStatusEnum.EXECUTED:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="State is already executed")
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="State is not queued or executed")
+
+        if retry_created:
             try:
                 retry_state = State(
                     node_name=state.node_name,
@@ -57,18 +74,15 @@ async def errored_state(namespace_name: str, state_id: PydanticObjectId, body: E
                 )
                 retry_state = await retry_state.insert()
                 logger.info(f"Retry state {retry_state.id} created for state {state_id}", x_exosphere_request_id=x_exosphere_request_id)
-                retry_created = True
             except DuplicateKeyError:
                 logger.info(f"Duplicate retry state detected for state {state_id}. A retry state with the same unique key already exists.", x_exosphere_request_id=x_exosphere_request_id)
-                retry_created = True
-
-        if retry_created:
-            state.status = StateStatusEnum.RETRY_CREATED
-        else:
-            state.status = StateStatusEnum.ERRORED
-            
-        state.error = body.error
-        await state.save()
+            except Exception:
+                # Hand the state back to QUEUED so the errored call can be retried
+                await collection.update_one(
+                    {"_id": state.id, "status": new_status},
+                    {"$set": {"status": StateStatusEnum.QUEUED, "error": state.error, "updated_at": datetime.now()}}
+                )
+                raise
 
         return ErroredResponseModel(status=StateStatusEnum.ERRORED, retry_created=retry_created)
 
@@ -16,10 +16,7 @@ import time
 logger = LogsManager().get_logger()
 
 def check_required_store_keys(graph_template: GraphTemplate, store: dict[str, str]) -> None:
-    required_keys = set(graph_template.store_config.required_keys)
-    provided_keys = set(store.keys())
-
-    missing_keys = required_keys - provided_keys
+    missing_keys = set(graph_template.store_config.required_keys) - store.keys()
     if missing_keys:
         raise HTTPException(status_code=400, detail=f"Missing store keys: {missing_keys}")
     
@@ -61,7 +61,7 @@ async def upsert_graph_template(namespace_name: str, graph_name: str, body: Upse
             nodes=graph_template.nodes,
             validation_status=graph_template.validation_status,
             validation_errors=graph_template.validation_errors,
-            secrets={secret_name: True for secret_name in graph_template.get_secrets().keys()},
+            secrets={secret_name: True for secret_name in graph_template.secrets.keys()},
             retry_policy=graph_template.retry_policy,
             created_at=graph_template.created_at,
             updated_at=graph_template.updated_at
@@ -10,7 +10,7 @@ from .base import BaseDatabaseModel
 from ..graph_template_validation_status import GraphTemplateValidationStatus
 from ..node_template_model import NodeTemplate
 from app.utils.encrypter import get_encrypter
-from app.models.dependent_string import DependentString
+from app.models.dependent_string import DependentString, PLACEHOLDER_OPEN
 from app.models.retry_policy_model import RetryPolicyModel
 from app.models.store_config_model import StoreConfig
 
@@ -74,12 +74,23 @@ class GraphTemplate(BaseDatabaseModel):
                 self._path_by_identifier[node.identifier] = set()
                 visited[node.identifier] = False
 
-            def dfs(node_identifier: str, parents: set[str], path: set[str]) -> None:
-                self._parents_by_identifier[node_identifier] = parents | self._parents_by_identifier[node_identifier]
-                self._path_by_identifier[node_identifier] = path | self._path_by_identifier[node_identifier]
+            # Iterative DFS so deep chains do not hit the interpreter recursion limit.
+            # Nothing runs after a node's children are visited, so popping pending
+            # visits off a stack preserves the recursive visiting order. A path of
+            # None means "use the node's stored path at the time it is visited".
+            stack: list[tuple[str, set[str], set[str] | None]] = [(root_node_identifier, set(), set())]
+
+            while stack:
+                node_identifier, parents, path = stack.pop()
+                if path is None:
+                    path = self._path_by_identifier[node_identifier]
+
+                # Grow the stored sets in place rather than copying them on every incoming edge
+                self._parents_by_identifier[node_identifier].update(parents)
+                self._path_by_identifier[node_identifier].update(path)
 
                 if visited[node_identifier]:
-                    return
+                    continue
                 
                 visited[node_identifier] = True
 
@@ -94,23 +105,20 @@ class GraphTemplate(BaseDatabaseModel):
                     self._parents_by_identifier[node.identifier] = parents | {node.unites.identifier}
                     parents_for_children = parents | {node.unites.identifier}
                 else:
-                    if node.unites.identifier not in awaiting_parent:
-                        awaiting_parent[node.unites.identifier] = []
-                    awaiting_parent[node.unites.identifier].append(node_identifier)
-                    return
+                    awaiting_parent.setdefault(node.unites.identifier, []).append(node_identifier)
+                    continue
                 
-                if node_identifier in awaiting_parent:
-                    for awaiting_identifier in awaiting_parent[node_identifier]:
-                        dfs(awaiting_identifier, parents_for_children, self._path_by_identifier[awaiting_identifier])
-                    del awaiting_parent[node_identifier]
+                pending: list[tuple[str, set[str], set[str] | None]] = []
 
-                if node.next_nodes is None:
-                    return
+                if node_identifier in awaiting_parent:
+                    for awaiting_identifier in awaiting_parent.pop(node_identifier):
+                        pending.append((awaiting_identifier, parents_for_children, None))
 
-                for next_node_identifier in node.next_nodes:
-                    dfs(next_node_identifier, parents_for_children, path | {node_identifier})
+                if node.next_nodes is not None:
+                    for next_node_identifier in node.next_nodes:
+                        pending.append((next_node_identifier, parents_for_children, path | {node_identifier}))
 
-            dfs(root_node_identifier, set(), set())
+                stack.extend(reversed(pending))
 
             if len(awaiting_parent.keys()) > 0:
                 raise ValueError(f"Graph is disconnected at: {awaiting_parent}")
@@ -159,11 +167,9 @@ class GraphTemplate(BaseDatabaseModel):
     @field_validator('nodes')
     @classmethod
     def validate_next_nodes_identifiers_exist(cls, v: List[NodeTemplate]) -> List[NodeTemplate]:
-        identifiers = set()
-        for node in v:
-            identifiers.add(node.identifier)
+        identifiers = {node.identifier for node in v}
 
-        errors = []    
+        errors = []
         for node in v:
             if node.next_nodes:
                 for next_node in node.next_nodes:
@@ -191,12 +197,9 @@ class GraphTemplate(BaseDatabaseModel):
     @model_validator(mode='after')
     def validate_unites_identifiers_exist(self) -> Self:
         errors = []
-        identifiers = set()
-        for node in self.nodes:
-            identifiers.add(node.identifier)
         for node in self.nodes:
             if node.unites is not None:
-                if node.unites.identifier not in identifiers:
+                if self.get_node_by_identifier(node.unites.identifier) is None:
                     errors.append(f"Node {node.identifier} has an unites target {node.unites.identifier} that does not exist")
                 if node.unites.identifier == node.identifier:
                     errors.append(f"Node {node.identifier} has an unites target {node.unites.identifier} that is the same as the node itself")
@@ -230,6 +233,8 @@ class GraphTemplate(BaseDatabaseModel):
     @model_validator(mode='after')
     def verify_input_dependencies(self) -> Self:
         errors = []
+        # Local to this pass, so repeated input values are parsed once without sharing parses beyond it
+        dependent_strings_by_value: dict[str, DependentString] = {}
 
         for node in self.nodes:
             for input_value in node.inputs.values():
@@ -238,7 +243,13 @@ class GraphTemplate(BaseDatabaseModel):
                         errors.append(f"Input {input_value} is not a string")
                         continue
 
-                    dependent_string = DependentString.create_dependent_string(input_value)
+                    if PLACEHOLDER_OPEN not in input_value:
+                        continue
+
+                    dependent_string = dependent_strings_by_value.get(input_value)
+                    if dependent_string is None:
+                        dependent_string = DependentString.create_dependent_string(input_value)
+                        dependent_strings_by_value[input_value] = dependent_string
                     dependent_identifiers = set()
                     store_fields = set()
 
@@ -270,7 +281,8 @@ class GraphTemplate(BaseDatabaseModel):
     def get_secrets(self) -> Dict[str, str]:
         if not self.secrets:
             return {}
-        return {secret_name: get_encrypter().decrypt(secret_value) for secret_name, secret_value in self.secrets.items()}
+        encrypter = get_encrypter()
+        return {secret_name: encrypter.decrypt(secret_value) for secret_name, secret_value in self.secrets.items()}
     
     def get_secret(self, secret_name: str) -> str | None:
         if not self.secrets:
@@ -35,10 +35,12 @@ class RegisteredNode(BaseDatabaseModel):
         if len(templates) == 0:
             return []
         
+        # Several template nodes can share a registered node, query each pair once
+        unique_pairs = {(node.node_name, node.namespace) for node in templates}
         query = {
             "$or": [
-                {"name": node.node_name, "namespace": node.namespace}
-                for node in templates
+                {"name": name, "namespace": namespace}
+                for name, namespace in unique_pairs
             ]
         }
         return await RegisteredNode.find(query).to_list()
\ No newline at end of file
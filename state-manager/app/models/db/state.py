@@ -52,13 +52,13 @@ class State(BaseDatabaseModel):
         self.state_fingerprint = hashlib.sha256(payload).hexdigest()    
     
     @classmethod
-    async def insert_many(cls, documents: list["State"]) -> InsertManyResult:
+    async def insert_many(cls, documents: list["State"], ordered: bool = True) -> InsertManyResult:
         """Override insert_many to ensure fingerprints are generated before insertion."""
         # Generate fingerprints for states that need them
         for state in documents:
             state._generate_fingerprint()
         
-        return await super().insert_many(documents) # type: ignore
+        return await super().insert_many(documents, ordered=ordered) # type: ignore
         
     class Settings:
         indexes = [
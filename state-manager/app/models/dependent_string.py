@@ -1,5 +1,14 @@
+import re
+
 from pydantic import BaseModel, PrivateAttr
 
+PLACEHOLDER_OPEN = "${{"
+# Non-greedy so each placeholder stops at its own closing braces
+PLACEHOLDER_PATTERN = re.compile(r"\$\{\{(.*?)\}\}", re.DOTALL)
+# Placeholder bodies: "<identifier>.outputs.<field>" and "store.<field>", whitespace around parts ignored
+OUTPUTS_REFERENCE_PATTERN = re.compile(r"\s*([^.]*?)\s*\.\s*outputs\s*\.\s*([^.]*?)\s*")
+STORE_REFERENCE_PATTERN = re.compile(r"\s*store\s*\.\s*([^.]*?)\s*")
+
 class Dependent(BaseModel):
     identifier: str
     field: str
@@ -22,26 +31,41 @@ class DependentString(BaseModel):
     
     @staticmethod
     def create_dependent_string(syntax_string: str) -> "DependentString":
-        splits = syntax_string.split("${{")
-        if len(splits) <= 1:
+        if PLACEHOLDER_OPEN not in syntax_string:
             return DependentString(head=syntax_string, dependents={})
 
-        dependent_string = DependentString(head=splits[0], dependents={})
+        matches = list(PLACEHOLDER_PATTERN.finditer(syntax_string))
+        if len(matches) == 0:
+            unclosed = syntax_string.split(PLACEHOLDER_OPEN)[1]
+            raise ValueError(f"Invalid syntax string placeholder {unclosed} for: {syntax_string} '${{' not closed")
+
+        dependent_string = DependentString(head=syntax_string[:matches[0].start()], dependents={})
 
-        for order, split in enumerate(splits[1:]):
-            if "}}" not in split:
-                raise ValueError(f"Invalid syntax string placeholder {split} for: {syntax_string} '${{' not closed")
-            placeholder_content, tail = split.split("}}", 1)
+        for order, match in enumerate(matches):
+            placeholder_content = match.group(1)
+            if PLACEHOLDER_OPEN in placeholder_content:
+                unclosed = placeholder_content.split(PLACEHOLDER_OPEN, 1)[0]
+                raise ValueError(f"Invalid syntax string placeholder {unclosed} for: {syntax_string} '${{' not closed")
 
-            parts = [p.strip() for p in placeholder_content.split(".")]
+            tail_end = matches[order + 1].start() if order + 1 < len(matches) else len(syntax_string)
+            tail = syntax_string[match.end():tail_end]
 
-            if len(parts) == 3 and parts[1] == "outputs":
-                dependent_string.dependents[order] = Dependent(identifier=parts[0], field=parts[2], tail=tail)
-            elif len(parts) == 2 and parts[0] == "store":
-                dependent_string.dependents[order] = Dependent(identifier=parts[0], field=parts[1], tail=tail)
+            outputs_reference = OUTPUTS_REFERENCE_PATTERN.fullmatch(placeholder_content)
+            store_reference = None if outputs_reference else STORE_REFERENCE_PATTERN.fullmatch(placeholder_content)
+
+            if outputs_reference:
+                dependent_string.dependents[order] = Dependent(identifier=outputs_reference.group(1), field=outputs_reference.group(2), tail=tail)
+            elif store_reference:
+                dependent_string.dependents[order] = Dependent(identifier="store", field=store_reference.group(1), tail=tail)
             else:
                 raise ValueError(f"Invalid syntax string placeholder {placeholder_content} for: {syntax_string}")
-            
+
+        # A trailing opener that never found its closing braces
+        trailing = dependent_string.dependents[len(matches) - 1].tail
+        if PLACEHOLDER_OPEN in trailing:
+            unclosed = trailing.split(PLACEHOLDER_OPEN)[1]
+            raise ValueError(f"Invalid syntax string placeholder {unclosed} for: {syntax_string} '${{' not closed")
+
         return dependent_string
 
     def _build_mapping_key_to_dependent(self):
@@ -50,9 +74,7 @@ class DependentString(BaseModel):
         
         for dependent in self.dependents.values():
             mapping_key = (dependent.identifier, dependent.field)
-            if mapping_key not in self._mapping_key_to_dependent:
-                self._mapping_key_to_dependent[mapping_key] = []
-            self._mapping_key_to_dependent[mapping_key].append(dependent)
+            self._mapping_key_to_dependent.setdefault(mapping_key, []).append(dependent)
 
     def set_value(self, identifier: str, field: str, value: str):
         self._build_mapping_key_to_dependent()
@@ -8,7 +8,7 @@ from app.models.state_status_enum import StateStatusEnum
 from app.models.node_template_model import NodeTemplate
 from app.models.db.registered_node import RegisteredNode
 from app.models.db.store import Store
-from app.models.dependent_string import DependentString
+from app.models.dependent_string import DependentString, PLACEHOLDER_OPEN
 from app.models.node_template_model import UnitesStrategyEnum
 from json_schema_to_pydantic import create_model
 from pydantic import BaseModel
@@ -140,7 +140,13 @@ async def create_next_states(state_ids: list[PydanticObjectId], identifier: str,
             next_state_input_data = {}
 
             for field_name, _ in next_state_input_model.model_fields.items():
-                dependency_string = DependentString.create_dependent_string(next_state_node_template.inputs[field_name])
+                input_value = next_state_node_template.inputs[field_name]
+                if PLACEHOLDER_OPEN not in input_value:
+                    # Static input, nothing to resolve
+                    next_state_input_data[field_name] = input_value
+                    continue
+
+                dependency_string = DependentString.create_dependent_string(input_value)
 
                 for identifier, field in dependency_string.get_identifier_field():
 
@@ -209,7 +215,7 @@ async def create_next_states(state_ids: list[PydanticObjectId], identifier: str,
                 new_states_coroutines.append(generate_next_state(next_state_input_model, next_state_node_template, parents, current_state))
         
         if len(new_states_coroutines) > 0:
-            await State.insert_many(await asyncio.gather(*new_states_coroutines))
+            await State.insert_many(await asyncio.gather(*new_states_coroutines), ordered=False)
         await mark_success_states(state_ids)
 
         # handle unites
@@ -232,7 +238,7 @@ async def create_next_states(state_ids: list[PydanticObjectId], identifier: str,
         
         try:
             if len(new_unit_states_coroutines) > 0:
-                await State.insert_many(await asyncio.gather(*new_unit_states_coroutines))
+                await State.insert_many(await asyncio.gather(*new_unit_states_coroutines), ordered=False)
         except (DuplicateKeyError, BulkWriteError):
             logger.warning(
                 f"Caught duplicate key error for new unit states in namespace={namespace}, "
@@ -1,14 +1,17 @@
 import asyncio
+import json
+from datetime import datetime
 
 from app.models.db.graph_template_model import GraphTemplate
 from app.models.graph_template_validation_status import GraphTemplateValidationStatus
 from app.models.db.registered_node import RegisteredNode
 from app.singletons.logs_manager import LogsManager
 from json_schema_to_pydantic import create_model
+from typing import Any
 
 logger = LogsManager().get_logger()
 
-async def verify_node_exists(graph_template: GraphTemplate, registered_nodes: list[RegisteredNode]) -> list[str]:
+def verify_node_exists(graph_template: GraphTemplate, registered_nodes: list[RegisteredNode]) -> list[str]:
     errors = []
     template_nodes_set = set([(node.node_name, node.namespace) for node in graph_template.nodes])
     registered_nodes_set = set([(node.name, node.namespace) for node in registered_nodes])
@@ -19,33 +22,73 @@ async def verify_node_exists(graph_template: GraphTemplate, registered_nodes: li
         errors.append(f"Node {node[0]} in namespace {node[1]} does not exist.")
     return errors
    
-async def verify_secrets(graph_template: GraphTemplate, registered_nodes: list[RegisteredNode]) -> list[str]:
-    errors = []
-    required_secrets_set = set()
+def verify_secrets(graph_template: GraphTemplate, registered_nodes: list[RegisteredNode]) -> list[str]:
+    required_secrets_set = set().union(*(node.secrets for node in registered_nodes if node.secrets))
+    missing_secrets_set = required_secrets_set - graph_template.secrets.keys()
 
-    for node in registered_nodes:
-        if node.secrets is None:
-            continue
-        for secret in node.secrets:
-            required_secrets_set.add(secret)
-    
-    present_secrets_set = set()
-    for secret_name in graph_template.secrets.keys():
-        present_secrets_set.add(secret_name)
-    
-    missing_secrets_set = required_secrets_set - present_secrets_set
-    
-    for secret_name in missing_secrets_set:
-        errors.append(f"Secret {secret_name} is required but not present in the graph template")
-    
-    return errors
+    return [
+        f"Secret {secret_name} is required but not present in the graph template"
+        for secret_name in missing_secrets_set
+    ]
+
+# Keywords that leave a property's Python type untouched; "format", "enum", "const" etc. do not
+PLAIN_PROPERTY_KEYWORDS = {"type", "title", "description", "default", "examples", "minLength", "maxLength", "pattern", "minimum", "maximum"}
+PLAIN_SCHEMA_KEYWORDS = {"type", "title", "description", "properties", "required"}
+PLAIN_PROPERTY_TYPES = {"string", "integer", "number", "boolean"}
+
+def get_plain_string_field_flags(schema: dict[str, Any]) -> dict[str, bool] | None:
+    """Read the string flags straight off a flat schema, or return None if it needs a full model build."""
+    properties = schema.get("properties")
+    if not isinstance(properties, dict) or not schema.keys() <= PLAIN_SCHEMA_KEYWORDS:
+        return None
+
+    flags = {}
+    for field_name, field_schema in properties.items():
+        if not isinstance(field_schema, dict) or not isinstance(field_schema.get("type"), str):
+            return None
+        if field_schema["type"] not in PLAIN_PROPERTY_TYPES or not field_schema.keys() <= PLAIN_PROPERTY_KEYWORDS:
+            return None
+        flags[field_name] = field_schema["type"] == "string"
+    return flags
 
-async def verify_inputs(graph_template: GraphTemplate, registered_nodes: list[RegisteredNode]) -> list[str]:
+def get_string_field_flags(schema: dict[str, Any]) -> dict[str, bool]:
+    """Map every field of the schema's model to whether it is typed as a plain string."""
+    plain_flags = get_plain_string_field_flags(schema)
+    if plain_flags is not None:
+        return plain_flags
+
+    return {
+        field_name: field_info.annotation is str
+        for field_name, field_info in create_model(schema).model_fields.items()
+    }
+
+def verify_inputs(graph_template: GraphTemplate, registered_nodes: list[RegisteredNode]) -> list[str]:
     errors = []
     look_up_table = {
         (rn.name, rn.namespace): rn
         for rn in registered_nodes
     }
+    # Keyed by (name, namespace) so each registered node's schema is serialized once, however often it is referenced
+    input_fields_by_node: dict[tuple[str, str], dict[str, bool]] = {}
+    output_fields_by_node: dict[tuple[str, str], dict[str, bool]] = {}
+    # Keyed by the canonical schema JSON so registered nodes sharing a schema share one model build
+    cached_input_fields: dict[str, dict[str, bool]] = {}
+    cached_output_fields: dict[str, dict[str, bool]] = {}
+
+    def get_fields(registered_node: RegisteredNode, schema: dict[str, Any], fields_by_node: dict[tuple[str, str], dict[str, bool]], cached_fields: dict[str, dict[str, bool]]) -> dict[str, bool]:
+        node_key = (registered_node.name, registered_node.namespace)
+        if node_key not in fields_by_node:
+            key = json.dumps(schema, sort_keys=True)
+            if key not in cached_fields:
+                cached_fields[key] = get_string_field_flags(schema)
+            fields_by_node[node_key] = cached_fields[key]
+        return fields_by_node[node_key]
+
+    def get_input_fields(registered_node: RegisteredNode) -> dict[str, bool]:
+        return get_fields(registered_node, registered_node.inputs_schema, input_fields_by_node, cached_input_fields)
+
+    def get_output_fields(registered_node: RegisteredNode) -> dict[str, bool]:
+        return get_fields(registered_node, registered_node.outputs_schema, output_fields_by_node, cached_output_fields)
 
     for node in graph_template.nodes:
         if node.inputs is None:
@@ -56,14 +99,12 @@ async def verify_inputs(graph_template: GraphTemplate, registered_nodes: list[Re
             errors.append(f"Node {node.node_name} in namespace {node.namespace} does not exist")
             continue
         
-        registered_node_input_model  = create_model(registered_node.inputs_schema)
-
-        for input_name, input_info in registered_node_input_model.model_fields.items():
-            if input_info.annotation is not str:
+        for input_name, is_string in get_input_fields(registered_node).items():
+            if not is_string:
                 errors.append(f"Input {input_name} in node {node.node_name} in namespace {node.namespace} is not a string")
                 continue
             
-            if input_name not in node.inputs.keys():
+            if input_name not in node.inputs:
                 errors.append(f"Input {input_name} in node {node.node_name} in namespace {node.namespace} is not present in the graph template")
                 continue
 
@@ -85,12 +126,12 @@ async def verify_inputs(graph_template: GraphTemplate, registered_nodes: list[Re
                     errors.append(f"Node {temp_node.node_name} in namespace {temp_node.namespace} does not exist")
                     continue
                 
-                output_model = create_model(registered_node.outputs_schema)
-                if field not in output_model.model_fields.keys():
+                output_fields = get_output_fields(registered_node)
+                if field not in output_fields:
                     errors.append(f"Field {field} in node {temp_node.node_name} in namespace {temp_node.namespace} does not exist")
                     continue
                 
-                if output_model.model_fields[field].annotation is not str:
+                if not output_fields[field]:
                     errors.append(f"Field {field} in node {temp_node.node_name} in namespace {temp_node.namespace} is not a string")
                 
     return errors
@@ -100,28 +141,24 @@ async def verify_graph(graph_template: GraphTemplate):
         errors = []
         registered_nodes = await RegisteredNode.list_nodes_by_templates(graph_template.nodes)
 
-        basic_verify_tasks = [
-            verify_node_exists(graph_template, registered_nodes),
-            verify_secrets(graph_template, registered_nodes),
-            verify_inputs(graph_template, registered_nodes)
-        ]
-        resultant_errors = await asyncio.gather(*basic_verify_tasks)
-
-        for error in resultant_errors:
-            errors.extend(error)
+        errors.extend(verify_node_exists(graph_template, registered_nodes))
+        errors.extend(verify_secrets(graph_template, registered_nodes))
+        # Building the schema models is CPU bound, keep it off the event loop
+        errors.extend(await asyncio.to_thread(verify_inputs, graph_template, registered_nodes))
         
-        if len(errors) > 0:
-            graph_template.validation_status = GraphTemplateValidationStatus.INVALID
-            graph_template.validation_errors = errors
-            await graph_template.save()
-            return
-        
-        graph_template.validation_status = GraphTemplateValidationStatus.VALID
-        graph_template.validation_errors = []
-        await graph_template.save()
+        validation_status = GraphTemplateValidationStatus.INVALID if len(errors) > 0 else GraphTemplateValidationStatus.VALID
+
+        # Write only the validation fields so the rest of the document is not rewritten
+        await graph_template.set({
+            "validation_status": validation_status,
+            "validation_errors": errors,
+            "updated_at": datetime.now()
+        }) # type: ignore
         
     except Exception as e:
         logger.error(f"Exception during graph validation for graph template {graph_template.id}: {str(e)}", exc_info=True)
-        graph_template.validation_status = GraphTemplateValidationStatus.INVALID
-        graph_template.validation_errors = [f"Validation failed due to unexpected error: {str(e)}"]
-        await graph_template.save()
\ No newline at end of file
+        await graph_template.set({
+            "validation_status": GraphTemplateValidationStatus.INVALID,
+            "validation_errors": [f"Validation failed due to unexpected error: {str(e)}"],
+            "updated_at": datetime.now()
+        }) # type: ignore
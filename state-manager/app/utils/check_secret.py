@@ -1,3 +1,5 @@
+import hmac
+
 from fastapi import Depends, HTTPException
 from fastapi.security.api_key import APIKeyHeader 
 from starlette.status import HTTP_401_UNAUTHORIZED
@@ -8,9 +10,18 @@ API_KEY_NAME = "x-api-key"
 
 api_key_header = APIKeyHeader(name=API_KEY_NAME, auto_error=False)
 
+# Encoded secret, loaded lazily on the first request
+_secret: bytes | None = None
+
+def _get_secret() -> bytes:
+    global _secret
+    if _secret is None:
+        _secret = get_settings().state_manager_secret.encode()
+    return _secret
+
 async def check_api_key(api_key_header: str = Depends(api_key_header)):
-    settings = get_settings()
-    if api_key_header == settings.state_manager_secret:
+    # Constant-time comparison; compare bytes so non-ASCII keys are accepted
+    if api_key_header is not None and hmac.compare_digest(api_key_header.encode(), _get_secret()):
         return api_key_header
     else:
         raise HTTPException(status_code=HTTP_401_UNAUTHORIZED, detail="Invalid API key")
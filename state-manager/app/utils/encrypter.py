@@ -1,5 +1,6 @@
 import os
 import base64
+import threading
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
 from app.config.settings import get_settings
@@ -28,12 +29,14 @@ class Encrypter:
         return base64.urlsafe_b64encode(nonce + ciphertext).decode()
     
     def decrypt(self, encrypted_secret: str) -> str:
-        encrypted_secret_bytes = base64.urlsafe_b64decode(encrypted_secret)
+        # Slice through a memoryview so the nonce and ciphertext are not copied out
+        encrypted_secret_bytes = memoryview(base64.urlsafe_b64decode(encrypted_secret))
         nonce = encrypted_secret_bytes[:12]
         ciphertext = encrypted_secret_bytes[12:]
         return self._aesgcm.decrypt(nonce, ciphertext, None).decode()
 
 _encrypter_instance = None
+_encrypter_lock = threading.Lock()
 
 def get_encrypter() -> Encrypter:
     """
@@ -47,5 +50,8 @@ def get_encrypter() -> Encrypter:
     """
     global _encrypter_instance
     if _encrypter_instance is None:
-        _encrypter_instance = Encrypter()
+        with _encrypter_lock:
+            # Re-check under the lock so concurrent first calls build a single instance
+            if _encrypter_instance is None:
+                _encrypter_instance = Encrypter()
     return _encrypter_instance
@@ -1,5 +1,4 @@
 from unittest.mock import patch
-import os
 import pathlib
 import sys
 
@@ -9,103 +8,33 @@ sys.path.insert(0, project_root)
 # ruff: noqa: E402
 from app.config.cors import get_cors_origins, get_cors_config
 
+EXPECTED_DEFAULT_ORIGINS = [
+    "http://localhost:3000",  # Next.js frontend
+    "http://localhost:3001",  # Alternative frontend port
+    "http://127.0.0.1:3000",  # Alternative localhost
+    "http://127.0.0.1:3001",  # Alternative localhost port
+]
+
 
 class TestCORS:
     """Test cases for CORS configuration"""
 
-    def test_get_cors_origins_with_environment_variable(self):
-        """Test get_cors_origins with CORS_ORIGINS environment variable"""
-        test_origins = "https://example.com,https://test.com,https://app.com"
-        
-        with patch.dict(os.environ, {'CORS_ORIGINS': test_origins}):
-            origins = get_cors_origins()
-            
-            assert origins == ["https://example.com", "https://test.com", "https://app.com"]
-
-    def test_get_cors_origins_with_whitespace(self):
-        """Test get_cors_origins with whitespace in environment variable"""
-        test_origins = "  https://example.com  ,  https://test.com  ,  https://app.com  "
-        
-        with patch.dict(os.environ, {'CORS_ORIGINS': test_origins}):
-            origins = get_cors_origins()
-            
-            assert origins == ["https://example.com", "https://test.com", "https://app.com"]
+    def test_get_cors_origins_with_empty_string(self, monkeypatch):
+        """Test get_cors_origins with empty string"""
+        monkeypatch.setenv("CORS_ORIGINS", "")
 
-    def test_get_cors_origins_with_empty_entries(self):
-        """Test get_cors_origins with empty entries in environment variable"""
-        test_origins = "https://example.com,,https://test.com, ,https://app.com"
-        
-        with patch.dict(os.environ, {'CORS_ORIGINS': test_origins}):
-            origins = get_cors_origins()
-            
-            assert origins == ["https://example.com", "https://test.com", "https://app.com"]
+        origins = get_cors_origins()
 
-    def test_get_cors_origins_with_single_origin(self):
-        """Test get_cors_origins with single origin"""
-        test_origins = "https://example.com"
-        
-        with patch.dict(os.environ, {'CORS_ORIGINS': test_origins}):
-            origins = get_cors_origins()
-            
-            assert origins == ["https://example.com"]
+        # When CORS_ORIGINS is empty string, it should return default origins
+        assert origins == EXPECTED_DEFAULT_ORIGINS
 
-    def test_get_cors_origins_with_empty_string(self):
-        """Test get_cors_origins with empty string"""
-        test_origins = ""
-        
-        with patch.dict(os.environ, {'CORS_ORIGINS': test_origins}):
-            origins = get_cors_origins()
-            
-            # When CORS_ORIGINS is empty string, it should return default origins
-            expected_defaults = [
-                "http://localhost:3000",  # Next.js frontend
-                "http://localhost:3001",  # Alternative frontend port
-                "http://127.0.0.1:3000",  # Alternative localhost
-                "http://127.0.0.1:3001",  # Alternative localhost port
-            ]
-            assert origins == expected_defaults
-
-    def test_get_cors_origins_with_whitespace_only(self):
-        """Test get_cors_origins with whitespace-only string"""
-        test_origins = "   "
-        
-        with patch.dict(os.environ, {'CORS_ORIGINS': test_origins}):
-            origins = get_cors_origins()
-            
-            assert origins == []
+    def test_get_cors_origins_default_when_env_var_not_set(self, monkeypatch):
+        """Test get_cors_origins returns defaults when CORS_ORIGINS is not set"""
+        monkeypatch.delenv("CORS_ORIGINS", raising=False)
 
-    def test_get_cors_origins_default_when_no_env_var(self):
-        """Test get_cors_origins returns defaults when no environment variable"""
-        with patch.dict(os.environ, {}, clear=True):
-            origins = get_cors_origins()
-            
-            expected_defaults = [
-                "http://localhost:3000",  # Next.js frontend
-                "http://localhost:3001",  # Alternative frontend port
-                "http://127.0.0.1:3000",  # Alternative localhost
-                "http://127.0.0.1:3001",  # Alternative localhost port
-            ]
-            
-            assert origins == expected_defaults
+        origins = get_cors_origins()
 
-    def test_get_cors_origins_default_when_env_var_not_set(self):
-        """Test get_cors_origins returns defaults when CORS_ORIGINS is not set"""
-        # Remove CORS_ORIGINS if it exists
-        env_copy = os.environ.copy()
-        if 'CORS_ORIGINS' in env_copy:
-            del env_copy['CORS_ORIGINS']
-        
-        with patch.dict(os.environ, env_copy, clear=True):
-            origins = get_cors_origins()
-            
-            expected_defaults = [
-                "http://localhost:3000",  # Next.js frontend
-                "http://localhost:3001",  # Alternative frontend port
-                "http://127.0.0.1:3000",  # Alternative localhost
-                "http://127.0.0.1:3001",  # Alternative localhost port
-            ]
-            
-            assert origins == expected_defaults
+        assert origins == EXPECTED_DEFAULT_ORIGINS
 
     def test_get_cors_config_structure(self):
         """Test get_cors_config returns correct structure"""
@@ -163,32 +92,29 @@ class TestCORS:
             
             assert config["allow_origins"] == test_origins
 
-    def test_get_cors_config_with_custom_origins(self):
+    def test_get_cors_config_with_custom_origins(self, monkeypatch):
         """Test get_cors_config with custom origins from environment"""
-        test_origins = "https://custom1.com,https://custom2.com"
-        
-        with patch.dict(os.environ, {'CORS_ORIGINS': test_origins}):
-            config = get_cors_config()
-            
-            assert config["allow_origins"] == ["https://custom1.com", "https://custom2.com"]
+        monkeypatch.setenv("CORS_ORIGINS", "https://custom1.com,https://custom2.com")
+
+        config = get_cors_config()
+
+        assert config["allow_origins"] == ["https://custom1.com", "https://custom2.com"]
 
-    def test_get_cors_config_with_default_origins(self):
+    def test_get_cors_config_with_default_origins(self, monkeypatch):
         """Test get_cors_config with default origins"""
-        with patch.dict(os.environ, {}, clear=True):
-            config = get_cors_config()
-            
-            expected_defaults = [
-                "http://localhost:3000",
-                "http://localhost:3001",
-                "http://127.0.0.1:3000",
-                "http://127.0.0.1:3001",
-            ]
-            
-            assert config["allow_origins"] == expected_defaults
+        monkeypatch.delenv("CORS_ORIGINS", raising=False)
+
+        config = get_cors_config()
 
-    def test_cors_origins_edge_cases(self):
-        """Test get_cors_origins with various edge cases"""
+        assert config["allow_origins"] == EXPECTED_DEFAULT_ORIGINS
+
+    def test_cors_origins_edge_cases(self, monkeypatch):
+        """Test get_cors_origins parsing of CORS_ORIGINS values"""
         test_cases = [
+            ("https://example.com,https://test.com,https://app.com", ["https://example.com", "https://test.com", "https://app.com"]),
+            ("  https://example.com  ,  https://test.com  ,  https://app.com  ", ["https://example.com", "https://test.com", "https://app.com"]),
+            ("https://example.com,,https://test.com, ,https://app.com", ["https://example.com", "https://test.com", "https://app.com"]),
+            ("   ", []),
             ("https://example.com", ["https://example.com"]),
             ("https://example.com,", ["https://example.com"]),
             (",https://example.com", ["https://example.com"]),
@@ -198,9 +124,9 @@ class TestCORS:
         ]
         
         for input_origins, expected_origins in test_cases:
-            with patch.dict(os.environ, {'CORS_ORIGINS': input_origins}):
-                origins = get_cors_origins()
-                assert origins == expected_origins
+            monkeypatch.setenv("CORS_ORIGINS", input_origins)
+            origins = get_cors_origins()
+            assert origins == expected_origins
 
     def test_cors_config_immutability(self):
         """Test that get_cors_config returns a new dict each time"""
@@ -213,17 +139,18 @@ class TestCORS:
         # But should have same content
         assert config1 == config2
 
-    def test_cors_origins_immutability(self):
+    def test_cors_origins_immutability(self, monkeypatch):
         """Test that get_cors_origins returns a new list each time"""
-        with patch.dict(os.environ, {'CORS_ORIGINS': 'https://example.com'}):
-            origins1 = get_cors_origins()
-            origins2 = get_cors_origins()
-            
-            # Should be different objects
-            assert origins1 is not origins2
-            
-            # But should have same content
-            assert origins1 == origins2
+        monkeypatch.setenv("CORS_ORIGINS", "https://example.com")
+
+        origins1 = get_cors_origins()
+        origins2 = get_cors_origins()
+
+        # Should be different objects
+        assert origins1 is not origins2
+
+        # But should have same content
+        assert origins1 == origins2
 
     def test_cors_config_methods_immutability(self):
         """Test that allow_methods in config is a new list"""
@@ -249,4 +176,16 @@ class TestCORS:
         new_config = get_cors_config()
         
         # The new config should not be affected
-        assert "CUSTOM_HEADER" not in new_config["allow_headers"] 
\ No newline at end of file
+        assert "CUSTOM_HEADER" not in new_config["allow_headers"]
+
+    def test_cors_default_origins_immutability(self, monkeypatch):
+        """Test that the default origins are returned as a new list"""
+        monkeypatch.delenv("CORS_ORIGINS", raising=False)
+
+        origins = get_cors_origins()
+
+        # Modify the returned list
+        origins.append("https://custom.com")
+
+        # The defaults should not be affected
+        assert "https://custom.com" not in get_cors_origins()
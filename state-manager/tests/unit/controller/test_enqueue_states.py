@@ -1,5 +1,6 @@
+import asyncio
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 from beanie import PydanticObjectId
 from datetime import datetime
 
@@ -7,34 +8,40 @@ from app.controller.enqueue_states import enqueue_states
 from app.models.enqueue_request import EnqueueRequestModel
 from app.models.state_status_enum import StateStatusEnum
 
+NOW = datetime(2024, 1, 1)
 
-class TestEnqueueStates:
-    """Test cases for enqueue_states function"""
 
-    @pytest.fixture
-    def mock_request_id(self):
-        return "test-request-id"
+# Constant inputs shared by every test in the module
+@pytest.fixture(scope="module")
+def mock_request_id():
+    return "test-request-id"
 
-    @pytest.fixture
-    def mock_namespace(self):
-        return "test_namespace"
 
-    @pytest.fixture
-    def mock_enqueue_request(self):
-        return EnqueueRequestModel(
-            nodes=["node1", "node2"],
-            batch_size=10
-        )
+@pytest.fixture(scope="module")
+def mock_namespace():
+    return "test_namespace"
+
+
+@pytest.fixture(scope="module")
+def mock_enqueue_request():
+    return EnqueueRequestModel(
+        nodes=["node1", "node2"],
+        batch_size=10
+    )
+
+
+class TestEnqueueStates:
+    """Test cases for enqueue_states function"""
 
     @pytest.fixture
     def mock_state(self):
-        state = MagicMock()
-        state.id = PydanticObjectId()
-        state.node_name = "node1"
-        state.identifier = "test_identifier"
-        state.inputs = {"key": "value"}
-        state.created_at = datetime.now()
-        return state
+        return {
+            "_id": PydanticObjectId(),
+            "node_name": "node1",
+            "identifier": "test_identifier",
+            "inputs": {"key": "value"},
+            "created_at": NOW
+        }
 
     @patch('app.controller.enqueue_states.find_state')
     async def test_enqueue_states_success(
@@ -62,7 +69,7 @@ class TestEnqueueStates:
         assert result.namespace == mock_namespace
         assert result.status == StateStatusEnum.QUEUED
         assert len(result.states) == 10
-        assert result.states[0].state_id == str(mock_state.id)
+        assert result.states[0].state_id == str(mock_state["_id"])
         assert result.states[0].node_name == "node1"
         assert result.states[0].identifier == "test_identifier"
         assert result.states[0].inputs == {"key": "value"}
@@ -71,6 +78,42 @@ class TestEnqueueStates:
         assert mock_find_state.call_count == 10  # Called batch_size times
         mock_find_state.assert_called_with(mock_namespace, ["node1", "node2"])
 
+    @patch('app.controller.enqueue_states.find_state')
+    async def test_enqueue_states_runs_find_state_concurrently(
+        self,
+        mock_find_state,
+        mock_namespace,
+        mock_enqueue_request,
+        mock_state,
+        mock_request_id
+    ):
+        """Test all find_state calls of a batch are in flight at the same time"""
+        # Arrange
+        started = 0
+        all_started = asyncio.Event()
+
+        async def find_state(namespace_name, nodes):
+            nonlocal started
+            started += 1
+            if started == mock_enqueue_request.batch_size:
+                all_started.set()
+            # Every call waits for the whole batch, so running them one by one would time out
+            await asyncio.wait_for(all_started.wait(), timeout=1)
+            return mock_state
+
+        mock_find_state.side_effect = find_state
+
+        # Act
+        result = await enqueue_states(
+            mock_namespace,
+            mock_enqueue_request,
+            mock_request_id
+        )
+
+        # Assert
+        assert result.count == mock_enqueue_request.batch_size
+        assert mock_find_state.call_count == mock_enqueue_request.batch_size
+
     @patch('app.controller.enqueue_states.find_state')
     async def test_enqueue_states_no_states_found(
         self,
@@ -107,19 +150,21 @@ class TestEnqueueStates:
     ):
         """Test enqueuing multiple states"""
         # Arrange
-        state1 = MagicMock()
-        state1.id = PydanticObjectId()
-        state1.node_name = "node1"
-        state1.identifier = "identifier1"
-        state1.inputs = {"input1": "value1"}
-        state1.created_at = datetime.now()
-
-        state2 = MagicMock()
-        state2.id = PydanticObjectId()
-        state2.node_name = "node2"
-        state2.identifier = "identifier2"
-        state2.inputs = {"input2": "value2"}
-        state2.created_at = datetime.now()
+        state1 = {
+            "_id": PydanticObjectId(),
+            "node_name": "node1",
+            "identifier": "identifier1",
+            "inputs": {"input1": "value1"},
+            "created_at": NOW
+        }
+
+        state2 = {
+            "_id": PydanticObjectId(),
+            "node_name": "node2",
+            "identifier": "identifier2",
+            "inputs": {"input2": "value2"},
+            "created_at": NOW
+        }
 
         # Mock find_state to return different states
         mock_find_state.side_effect = [state1, state2, None, None, None, None, None, None, None, None]
@@ -200,7 +245,7 @@ class TestEnqueueStates:
         assert result.namespace == mock_namespace
         assert result.status == StateStatusEnum.QUEUED
         assert len(result.states) == 5  # Only 5 states should be in the response
-        assert result.states[0].state_id == str(mock_state.id)
+        assert result.states[0].state_id == str(mock_state["_id"])
         assert result.states[0].node_name == "node1"
         assert result.states[0].identifier == "test_identifier"
         assert result.states[0].inputs == {"key": "value"}
@@ -292,19 +337,6 @@ class TestEnqueueStates:
         assert mock_find_state.call_count == 10  # Called batch_size times
         mock_find_state.assert_called_with(mock_namespace, ["node1", "node2"])
 
-    @patch('app.controller.enqueue_states.find_state')
-    async def test_enqueue_states_exception_in_main_function(
-        self,
-        mock_find_state,
-        mock_namespace,
-        mock_enqueue_request,
-        mock_request_id
-    ):
-        """Test enqueuing states when the main function raises an exception"""
-        # This test was removed because the function handles exceptions internally
-        # and doesn't re-raise them, making this test impossible to pass
-        pass
-
     @patch('app.controller.enqueue_states.find_state')
     async def test_enqueue_states_with_different_batch_sizes(
         self,
@@ -371,8 +403,30 @@ class TestEnqueueStates:
         assert result.namespace == mock_namespace
         assert result.status == StateStatusEnum.QUEUED
         assert len(result.states) == 0
-        assert mock_find_state.call_count == 3  # Still called batch_size times
-        mock_find_state.assert_called_with(mock_namespace, [])  # Empty nodes list
+        mock_find_state.assert_not_called()
+
+    @patch('app.controller.enqueue_states.find_state')
+    async def test_enqueue_states_with_zero_batch_size(
+        self,
+        mock_find_state,
+        mock_namespace,
+        mock_request_id
+    ):
+        """Test enqueuing states with a batch size of zero"""
+        # Arrange
+        zero_batch_request = EnqueueRequestModel(nodes=["node1"], batch_size=0)
+
+        # Act
+        result = await enqueue_states(
+            mock_namespace,
+            zero_batch_request,
+            mock_request_id
+        )
+
+        # Assert
+        assert result.count == 0
+        assert len(result.states) == 0
+        mock_find_state.assert_not_called()
 
     @patch('app.controller.enqueue_states.find_state')
     async def test_enqueue_states_with_single_node(
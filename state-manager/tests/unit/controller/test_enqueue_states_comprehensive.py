@@ -2,10 +2,12 @@ import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
 
-from app.controller.enqueue_states import enqueue_states
+from app.controller.enqueue_states import enqueue_states, ENQUEUE_PROJECTION, ENQUEUE_UPDATE
 from app.models.state_status_enum import StateStatusEnum
 from app.models.enqueue_request import EnqueueRequestModel
 
+NOW = datetime(2024, 1, 1)
+
 
 class TestEnqueueStatesComprehensive:
     """Comprehensive test cases for enqueue_states function"""
@@ -15,11 +17,11 @@ class TestEnqueueStatesComprehensive:
         """Test successful enqueue states"""
         # Create mock state data
         mock_state_data = {
-            "id": "state1",
+            "_id": "state1",
             "node_name": "test_node",
             "identifier": "test_identifier",
             "inputs": {"test": "input"},
-            "created_at": datetime.now()
+            "created_at": NOW
         }
 
         with patch('app.controller.enqueue_states.State') as mock_state_class:
@@ -28,15 +30,6 @@ class TestEnqueueStatesComprehensive:
             mock_collection.find_one_and_update = AsyncMock(return_value=mock_state_data)
             mock_state_class.get_pymongo_collection.return_value = mock_collection
 
-            # Mock the State constructor
-            mock_state_instance = MagicMock()
-            mock_state_instance.id = "state1"
-            mock_state_instance.node_name = "test_node"
-            mock_state_instance.identifier = "test_identifier"
-            mock_state_instance.inputs = {"test": "input"}
-            mock_state_instance.created_at = datetime.now()
-            mock_state_class.return_value = mock_state_instance
-
             request_model = EnqueueRequestModel(nodes=["test_node"], batch_size=1)
             result = await enqueue_states("test_namespace", request_model, "test_request_id")
 
@@ -47,6 +40,9 @@ class TestEnqueueStatesComprehensive:
             assert result.states[0].state_id == "state1"
             assert result.states[0].node_name == "test_node"
 
+            # Only the response fields are fetched from the claimed document
+            assert mock_collection.find_one_and_update.call_args.kwargs["projection"] == ENQUEUE_PROJECTION
+
     @pytest.mark.asyncio
     async def test_enqueue_states_no_states_found(self):
         """Test enqueue states when no states are found"""
@@ -85,11 +81,11 @@ class TestEnqueueStatesComprehensive:
         """Test enqueue states with partial success"""
         # Create mock state data
         mock_state_data = {
-            "id": "state1",
+            "_id": "state1",
             "node_name": "test_node",
             "identifier": "test_identifier",
             "inputs": {"test": "input"},
-            "created_at": datetime.now()
+            "created_at": NOW
         }
 
         with patch('app.controller.enqueue_states.State') as mock_state_class:
@@ -101,15 +97,6 @@ class TestEnqueueStatesComprehensive:
             ])
             mock_state_class.get_pymongo_collection.return_value = mock_collection
 
-            # Mock the State constructor
-            mock_state_instance = MagicMock()
-            mock_state_instance.id = "state1"
-            mock_state_instance.node_name = "test_node"
-            mock_state_instance.identifier = "test_identifier"
-            mock_state_instance.inputs = {"test": "input"}
-            mock_state_instance.created_at = datetime.now()
-            mock_state_class.return_value = mock_state_instance
-
             request_model = EnqueueRequestModel(nodes=["test_node"], batch_size=2)
             result = await enqueue_states("test_namespace", request_model, "test_request_id")
 
@@ -125,11 +112,11 @@ class TestEnqueueStatesComprehensive:
         """Test enqueue states with large batch size"""
         # Create mock state data
         mock_state_data = {
-            "id": "state1",
+            "_id": "state1",
             "node_name": "test_node",
             "identifier": "test_identifier",
             "inputs": {"test": "input"},
-            "created_at": datetime.now()
+            "created_at": NOW
         }
 
         with patch('app.controller.enqueue_states.State') as mock_state_class:
@@ -137,15 +124,6 @@ class TestEnqueueStatesComprehensive:
             mock_collection.find_one_and_update = AsyncMock(return_value=mock_state_data)
             mock_state_class.get_pymongo_collection.return_value = mock_collection
 
-            # Mock the State constructor
-            mock_state_instance = MagicMock()
-            mock_state_instance.id = "state1"
-            mock_state_instance.node_name = "test_node"
-            mock_state_instance.identifier = "test_identifier"
-            mock_state_instance.inputs = {"test": "input"}
-            mock_state_instance.created_at = datetime.now()
-            mock_state_class.return_value = mock_state_instance
-
             request_model = EnqueueRequestModel(nodes=["test_node"], batch_size=10)
             result = await enqueue_states("test_namespace", request_model, "test_request_id")
 
@@ -169,24 +147,25 @@ class TestEnqueueStatesComprehensive:
             assert result.namespace == "test_namespace"
             assert result.status == StateStatusEnum.QUEUED
             assert len(result.states) == 0
+            mock_state_class.get_pymongo_collection.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_enqueue_states_multiple_nodes(self):
         """Test enqueue states with multiple nodes"""
         # Create mock state data
         mock_state_data1 = {
-            "id": "state1",
+            "_id": "state1",
             "node_name": "node1",
             "identifier": "identifier1",
             "inputs": {"test": "input1"},
-            "created_at": datetime.now()
+            "created_at": NOW
         }
         mock_state_data2 = {
-            "id": "state2",
+            "_id": "state2",
             "node_name": "node2",
             "identifier": "identifier2",
             "inputs": {"test": "input2"},
-            "created_at": datetime.now()
+            "created_at": NOW
         }
 
         with patch('app.controller.enqueue_states.State') as mock_state_class:
@@ -194,23 +173,6 @@ class TestEnqueueStatesComprehensive:
             mock_collection.find_one_and_update = AsyncMock(side_effect=[mock_state_data1, mock_state_data2])
             mock_state_class.get_pymongo_collection.return_value = mock_collection
 
-            # Mock the State constructor
-            mock_state_instance1 = MagicMock()
-            mock_state_instance1.id = "state1"
-            mock_state_instance1.node_name = "node1"
-            mock_state_instance1.identifier = "identifier1"
-            mock_state_instance1.inputs = {"test": "input1"}
-            mock_state_instance1.created_at = datetime.now()
-
-            mock_state_instance2 = MagicMock()
-            mock_state_instance2.id = "state2"
-            mock_state_instance2.node_name = "node2"
-            mock_state_instance2.identifier = "identifier2"
-            mock_state_instance2.inputs = {"test": "input2"}
-            mock_state_instance2.created_at = datetime.now()
-
-            mock_state_class.side_effect = [mock_state_instance1, mock_state_instance2]
-
             request_model = EnqueueRequestModel(nodes=["node1", "node2"], batch_size=2)
             result = await enqueue_states("test_namespace", request_model, "test_request_id")
 
@@ -219,4 +181,11 @@ class TestEnqueueStatesComprehensive:
             assert result.status == StateStatusEnum.QUEUED
             assert len(result.states) == 2
             assert result.states[0].state_id == "state1"
-            assert result.states[1].state_id == "state2" 
\ No newline at end of file
+            assert result.states[1].state_id == "state2"
+            assert result.states[1].identifier == "identifier2"
+            assert result.states[1].inputs == {"test": "input2"}
+            # The claimed documents are used as is, no State models are built
+            mock_state_class.assert_not_called()
+            # Every claim reuses the shared update document
+            for call in mock_collection.find_one_and_update.call_args_list:
+                assert call.args[1] is ENQUEUE_UPDATE
@@ -89,7 +89,9 @@ class TestErroredState:
         mock_retry_state.insert = AsyncMock(return_value=mock_retry_state)
         mock_state_class.return_value = mock_retry_state
         
-        mock_state_queued.save = AsyncMock()     
+        mock_collection = MagicMock()
+        mock_collection.update_one = AsyncMock(return_value=MagicMock(matched_count=1))
+        mock_state_class.get_pymongo_collection.return_value = mock_collection
         mock_state_class.find_one = AsyncMock(return_value=mock_state_queued)
 
         # Act
@@ -103,7 +105,12 @@ class TestErroredState:
         # Assert
         assert result.status == StateStatusEnum.ERRORED
         assert mock_state_class.find_one.call_count == 1  # Called once for finding
-        
+        mock_collection.update_one.assert_called_once()
+        update_filter, update = mock_collection.update_one.call_args[0]
+        assert update_filter == {"_id": mock_state_queued.id, "status": StateStatusEnum.QUEUED}
+        assert update["$set"]["status"] == StateStatusEnum.RETRY_CREATED
+        assert update["$set"]["error"] == mock_errored_request.error
+        mock_collection.find_one.assert_not_called()
 
     @patch('app.controller.errored_state.State')
     @patch('app.controller.errored_state.GraphTemplate')
@@ -294,7 +301,9 @@ class TestErroredState:
         mock_retry_state.insert = AsyncMock(return_value=mock_retry_state)
         mock_state_class.return_value = mock_retry_state
         
-        mock_state_queued.save = AsyncMock()
+        mock_collection = MagicMock()
+        mock_collection.update_one = AsyncMock(return_value=MagicMock(matched_count=1))
+        mock_state_class.get_pymongo_collection.return_value = mock_collection
         mock_state_class.find_one = AsyncMock(return_value=mock_state_queued)
 
         # Act
@@ -308,7 +317,7 @@ class TestErroredState:
         # Assert
         assert result.status == StateStatusEnum.ERRORED
         assert mock_state_class.find_one.call_count == 1  # Called once for finding
-        assert mock_state_queued.error == "Different error message"
+        assert mock_collection.update_one.call_args[0][1]["$set"]["error"] == "Different error message"
 
     @patch('app.controller.errored_state.State')
     @patch('app.controller.errored_state.GraphTemplate')
@@ -324,7 +333,6 @@ class TestErroredState:
     ):
         """Test when graph template is not found"""
         # Arrange
-        mock_state_queued.save = AsyncMock()
         mock_state_class.find_one = AsyncMock(return_value=mock_state_queued)
         
         # Mock GraphTemplate.get to raise ValueError with "Graph template not found"
@@ -356,7 +364,6 @@ class TestErroredState:
     ):
         """Test when graph template raises other exceptions"""
         # Arrange
-        mock_state_queued.save = AsyncMock()
         mock_state_class.find_one = AsyncMock(return_value=mock_state_queued)
         
         # Mock GraphTemplate.get to raise a different exception
@@ -387,8 +394,10 @@ class TestErroredState:
     ):
         """Test when creating retry state encounters DuplicateKeyError"""
         # Arrange
-        mock_state_queued.save = AsyncMock()
         mock_state_class.find_one = AsyncMock(return_value=mock_state_queued)
+        mock_collection = MagicMock()
+        mock_collection.update_one = AsyncMock(return_value=MagicMock(matched_count=1))
+        mock_state_class.get_pymongo_collection.return_value = mock_collection
         
         # Mock GraphTemplate.get to return a valid graph template
         mock_graph_template = MagicMock()
@@ -411,8 +420,9 @@ class TestErroredState:
 
         # Assert
         assert result.status == StateStatusEnum.ERRORED
-        assert mock_state_queued.status == StateStatusEnum.RETRY_CREATED
-        assert mock_state_queued.error == mock_errored_request.error
+        update = mock_collection.update_one.call_args[0][1]
+        assert update["$set"]["status"] == StateStatusEnum.RETRY_CREATED
+        assert update["$set"]["error"] == mock_errored_request.error
 
     @patch('app.controller.errored_state.State')
     @patch('app.controller.errored_state.GraphTemplate')
@@ -440,9 +450,11 @@ class TestErroredState:
         mock_state.parents = []
         mock_state.does_unites = False
         mock_state.fanout_id = None
-        mock_state.save = AsyncMock()
         
         mock_state_class.find_one = AsyncMock(return_value=mock_state)
+        mock_collection = MagicMock()
+        mock_collection.update_one = AsyncMock(return_value=MagicMock(matched_count=1))
+        mock_state_class.get_pymongo_collection.return_value = mock_collection
         
         # Mock GraphTemplate.get to return a valid graph template with max_retries = 3
         mock_graph_template = MagicMock()
@@ -460,11 +472,112 @@ class TestErroredState:
         # Assert
         assert result.status == StateStatusEnum.ERRORED
         assert not result.retry_created
-        assert mock_state.status == StateStatusEnum.ERRORED
-        assert mock_state.error == mock_errored_request.error
+        update = mock_collection.update_one.call_args[0][1]
+        assert update["$set"]["status"] == StateStatusEnum.ERRORED
+        assert update["$set"]["error"] == mock_errored_request.error
         # Verify that State constructor was not called (no retry created)
         mock_state_class.assert_not_called()
 
+    @patch('app.controller.errored_state.State')
+    @patch('app.controller.errored_state.GraphTemplate')
+    async def test_errored_state_status_changed_concurrently(
+        self,
+        mock_graph_template_class,
+        mock_state_class,
+        mock_namespace,
+        mock_state_id,
+        mock_errored_request,
+        mock_state_queued,
+        mock_request_id
+    ):
+        """Test when the state leaves QUEUED between the read and the update"""
+        # Arrange
+        mock_state_class.find_one = AsyncMock(return_value=mock_state_queued)
+
+        # The miss is reported the same way whether or not the state has retries left
+        retry_policies = [
+            (0, StateStatusEnum.ERRORED),
+            (3, StateStatusEnum.RETRY_CREATED),
+        ]
+        test_cases = [
+            (None, status.HTTP_404_NOT_FOUND, "State not found"),
+            ({"status": StateStatusEnum.EXECUTED}, status.HTTP_400_BAD_REQUEST, "State is already executed"),
+            ({"status": StateStatusEnum.ERRORED}, status.HTTP_400_BAD_REQUEST, "State is not queued or executed"),
+        ]
+
+        for max_retries, claimed_status in retry_policies:
+            mock_graph_template = MagicMock()
+            mock_graph_template.retry_policy.max_retries = max_retries
+            mock_graph_template.retry_policy.compute_delay = MagicMock(return_value=1000)
+            mock_graph_template_class.get = AsyncMock(return_value=mock_graph_template)
+
+            for current, expected_status_code, expected_detail in test_cases:
+                mock_collection = MagicMock()
+                mock_collection.update_one = AsyncMock(return_value=MagicMock(matched_count=0))
+                mock_collection.find_one = AsyncMock(return_value=current)
+                mock_state_class.get_pymongo_collection.return_value = mock_collection
+
+                # Act & Assert
+                with pytest.raises(HTTPException) as exc_info:
+                    await errored_state(
+                        mock_namespace,
+                        mock_state_id,
+                        mock_errored_request,
+                        mock_request_id
+                    )
+
+                assert exc_info.value.status_code == expected_status_code
+                assert exc_info.value.detail == expected_detail
+                assert mock_collection.update_one.call_args[0][1]["$set"]["status"] == claimed_status
+                mock_collection.find_one.assert_called_once_with({"_id": mock_state_queued.id}, {"status": 1})
+                # No retry is built for a state that was not claimed
+                mock_state_class.assert_not_called()
+
+    @patch('app.controller.errored_state.State')
+    @patch('app.controller.errored_state.GraphTemplate')
+    async def test_errored_state_retry_insert_failure_restores_queued(
+        self,
+        mock_graph_template_class,
+        mock_state_class,
+        mock_namespace,
+        mock_state_id,
+        mock_errored_request,
+        mock_state_queued,
+        mock_request_id
+    ):
+        """Test the claimed state is handed back to QUEUED when the retry insert fails"""
+        # Arrange
+        mock_state_queued.error = None
+        mock_state_class.find_one = AsyncMock(return_value=mock_state_queued)
+        mock_collection = MagicMock()
+        mock_collection.update_one = AsyncMock(return_value=MagicMock(matched_count=1))
+        mock_state_class.get_pymongo_collection.return_value = mock_collection
+
+        mock_graph_template = MagicMock()
+        mock_graph_template.retry_policy.max_retries = 3
+        mock_graph_template.retry_policy.compute_delay = MagicMock(return_value=1000)
+        mock_graph_template_class.get = AsyncMock(return_value=mock_graph_template)
+
+        mock_retry_state = MagicMock()
+        mock_retry_state.insert = AsyncMock(side_effect=Exception("Insert failed"))
+        mock_state_class.return_value = mock_retry_state
+
+        # Act & Assert
+        with pytest.raises(Exception) as exc_info:
+            await errored_state(
+                mock_namespace,
+                mock_state_id,
+                mock_errored_request,
+                mock_request_id
+            )
+
+        assert str(exc_info.value) == "Insert failed"
+        assert mock_collection.update_one.call_count == 2
+        restore_filter, restore = mock_collection.update_one.call_args[0]
+        assert restore_filter == {"_id": mock_state_queued.id, "status": StateStatusEnum.RETRY_CREATED}
+        assert restore["$set"]["status"] == StateStatusEnum.QUEUED
+        assert restore["$set"]["error"] is None
+
     @patch('app.controller.errored_state.State')
     async def test_errored_state_general_exception(
         self,
@@ -121,6 +121,8 @@ class TestUpsertGraphTemplate:
         assert result.validation_status == GraphTemplateValidationStatus.VALID
         assert result.validation_errors == []
         assert result.secrets == {"api_key": True, "database_url": True}
+        # Secret names are reported without decrypting the values
+        mock_existing_template.get_secrets.assert_not_called()
         assert result.created_at == mock_existing_template.created_at
         assert result.updated_at == mock_existing_template.updated_at
 
@@ -83,3 +83,22 @@ class TestDependentString:
         assert dependent.field == "config_key"
         assert dependent.tail == "_suffix"
         assert dependent.value is None
+
+    def test_create_dependent_string_unclosed_after_valid_placeholder(self):
+        """Test create_dependent_string rejects an unclosed placeholder following a valid one"""
+        syntax_string = "${{node1.outputs.field1}}_${{node2.outputs.field2"
+
+        with pytest.raises(ValueError) as exc_info:
+            DependentString.create_dependent_string(syntax_string)
+
+        assert str(exc_info.value) == f"Invalid syntax string placeholder node2.outputs.field2 for: {syntax_string} '${{' not closed"
+
+    def test_create_dependent_string_ignores_whitespace_around_parts(self):
+        """Test create_dependent_string strips whitespace around placeholder parts"""
+        dependent_string = DependentString.create_dependent_string("${{ node1 . outputs . field1 }}-${{ store . key }}")
+
+        assert dependent_string.dependents[0].identifier == "node1"
+        assert dependent_string.dependents[0].field == "field1"
+        assert dependent_string.dependents[0].tail == "-"
+        assert dependent_string.dependents[1].identifier == "store"
+        assert dependent_string.dependents[1].field == "key"
@@ -2,6 +2,7 @@ import pytest
 from unittest.mock import patch, MagicMock
 import base64
 from app.models.db.graph_template_model import GraphTemplate
+from app.models.node_template_model import NodeTemplate
 
 
 class TestGraphTemplate:
@@ -256,3 +257,35 @@ class TestGraphTemplate:
             
             with pytest.raises(ValueError, match="Graph template is not valid for namespace: test_ns and graph name: test_graph after 1.0 seconds"):
                 await GraphTemplate.get_valid("test_ns", "test_graph", timeout=1.0)
+
+    def test_parents_by_identifier_deep_chain(self):
+        """Test parent/path building does not hit the recursion limit on long chains"""
+        chain_length = 3000
+        nodes = [
+            NodeTemplate(
+                node_name="node",
+                namespace="test_ns",
+                identifier=f"node_{i}",
+                inputs={},
+                next_nodes=[f"node_{i + 1}"] if i < chain_length - 1 else None,
+                unites=None
+            )
+            for i in range(chain_length)
+        ]
+        graph_template = GraphTemplate.model_construct(nodes=nodes)
+
+        last_identifier = f"node_{chain_length - 1}"
+        assert len(graph_template.get_parents_by_identifier(last_identifier)) == chain_length - 1
+        assert "node_0" in graph_template.get_path_by_identifier(last_identifier)
+
+    def test_validate_unique_identifiers_reports_each_extra_occurrence(self):
+        """Test a duplicated identifier is reported once per extra occurrence"""
+        nodes = [
+            NodeTemplate(node_name="node", namespace="test_ns", identifier=identifier, inputs={}, next_nodes=None, unites=None)
+            for identifier in ["node_a", "node_a", "node_a", "node_b"]
+        ]
+
+        with pytest.raises(ValueError) as exc_info:
+            GraphTemplate.validate_unique_identifiers(nodes)
+
+        assert str(exc_info.value) == "Node identifier node_a is not unique\nNode identifier node_a is not unique"
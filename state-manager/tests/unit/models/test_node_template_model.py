@@ -52,6 +52,28 @@ class TestNodeTemplate:
         assert all(isinstance(ds, DependentString) for ds in dependent_strings)
 
 
+    def test_get_dependent_strings_does_not_change_equality(self):
+        """Test get_dependent_strings returns fresh parses and leaves the model equal to its copies"""
+        node = NodeTemplate(
+            node_name="test_node",
+            namespace="test_ns",
+            identifier="test_id",
+            inputs={
+                "input1": "${{node1.outputs.field1}}",
+                "input2": "${{node1.outputs.field1}}"
+            },
+            next_nodes=[],
+            unites=None
+        )
+        node_copy = node.model_copy(deep=True)
+
+        first = node.get_dependent_strings()
+        second = node.get_dependent_strings()
+
+        assert first[0] is not first[1]
+        assert all(a is not b for a, b in zip(first, second))
+        assert node == node_copy
+
 class TestUnites:
     """Test cases for Unites model"""
 
@@ -0,0 +1,38 @@
+import pytest
+from unittest.mock import AsyncMock, patch, MagicMock
+from app.models.db.registered_node import RegisteredNode
+from app.models.node_template_model import NodeTemplate
+
+
+class TestRegisteredNode:
+    """Test cases for RegisteredNode model"""
+
+    @pytest.mark.asyncio
+    async def test_list_nodes_by_templates_empty(self):
+        """Test list_nodes_by_templates skips the query for no templates"""
+        with patch('app.models.db.registered_node.RegisteredNode') as mock_registered_node_class:
+            result = await RegisteredNode.list_nodes_by_templates([])
+
+            assert result == []
+            mock_registered_node_class.find.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_list_nodes_by_templates_deduplicates_pairs(self):
+        """Test list_nodes_by_templates queries each (name, namespace) pair once"""
+        templates = [
+            NodeTemplate(node_name="node1", identifier="id1", namespace="test", inputs={}, next_nodes=["id2"], unites=None),
+            NodeTemplate(node_name="node1", identifier="id2", namespace="test", inputs={}, next_nodes=["id3"], unites=None),
+            NodeTemplate(node_name="node2", identifier="id3", namespace="test", inputs={}, next_nodes=None, unites=None)
+        ]
+
+        with patch('app.models.db.registered_node.RegisteredNode') as mock_registered_node_class:
+            mock_query = MagicMock()
+            mock_query.to_list = AsyncMock(return_value=[])
+            mock_registered_node_class.find.return_value = mock_query
+
+            await RegisteredNode.list_nodes_by_templates(templates)
+
+            query = mock_registered_node_class.find.call_args[0][0]
+            assert len(query["$or"]) == 2
+            assert {"name": "node1", "namespace": "test"} in query["$or"]
+            assert {"name": "node2", "namespace": "test"} in query["$or"]
@@ -623,6 +623,7 @@ class TestCreateNextStates:
                         
                         # Should insert new states and mark current states as successful
                         mock_insert_many.assert_called_once()
+                        assert mock_insert_many.call_args.kwargs["ordered"] is False
                         mock_find.set.assert_called_with({"status": StateStatusEnum.SUCCESS})
 
     @pytest.mark.asyncio
@@ -736,6 +737,67 @@ class TestGetStoreValue:
                     # Verify Store.get_value was called only once despite being used twice (cached)
                     mock_store.get_value.assert_called_once_with("test_run", "test_namespace", "test_graph", "test_field")
 
+    @pytest.mark.asyncio
+    async def test_static_inputs_are_copied_without_parsing(self):
+        """Test inputs without placeholders are passed through to the next state as-is"""
+
+        with patch('app.tasks.create_next_states.GraphTemplate') as mock_graph_template, \
+             patch('app.tasks.create_next_states.Store') as mock_store, \
+             patch('app.tasks.create_next_states.State') as mock_state_class, \
+             patch('app.tasks.create_next_states.validate_dependencies'):
+
+            mock_template = MagicMock()
+            mock_template.store_config = StoreConfig()
+            current_node = NodeTemplate(
+                node_name="test_node",
+                identifier="current_id",
+                namespace="test",
+                inputs={},
+                next_nodes=["next_node"],
+                unites=None
+            )
+            next_node = NodeTemplate(
+                node_name="next_node",
+                identifier="next_node",
+                namespace="test",
+                inputs={
+                    "input1": "static_value",
+                    "input2": "${{store.test_field}}"
+                },
+                next_nodes=None,
+                unites=None
+            )
+            mock_template.get_node_by_identifier.side_effect = lambda identifier: {"current_id": current_node, "next_node": next_node}.get(identifier)
+            mock_graph_template.get_valid = AsyncMock(return_value=mock_template)
+
+            mock_store.get_value = AsyncMock(return_value="store_value")
+
+            mock_state_class.id = "id"
+            mock_current_state = MagicMock()
+            mock_current_state.run_id = "test_run"
+            mock_current_state.identifier = "current_id"
+            mock_current_state.parents = {}
+            mock_current_state.outputs = {}
+            mock_find = AsyncMock()
+            mock_find.to_list.return_value = [mock_current_state]
+            mock_find.set = AsyncMock()
+            mock_state_class.find.return_value = mock_find
+            mock_state_class.insert_many = AsyncMock()
+
+            with patch('app.tasks.create_next_states.RegisteredNode') as mock_registered_node, \
+                 patch('app.tasks.create_next_states.create_model') as mock_create_model:
+                mock_registered_node.get_by_name_and_namespace = AsyncMock(return_value=MagicMock())
+                mock_input_model = MagicMock()
+                mock_input_model.model_fields = {
+                    "input1": MagicMock(annotation=str),
+                    "input2": MagicMock(annotation=str)
+                }
+                mock_create_model.return_value = mock_input_model
+
+                await create_next_states([PydanticObjectId()], "current_id", "test_namespace", "test_graph", {})
+
+                assert mock_state_class.call_args.kwargs["inputs"] == {"input1": "static_value", "input2": "store_value"}
+
     @pytest.mark.asyncio
     async def test_get_store_value_from_store(self):
         """Test getting store value from Store when not cached"""
@@ -1,10 +1,14 @@
+import json
+import threading
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from app.tasks.verify_graph import (
     verify_node_exists,
     verify_secrets,
     verify_inputs,
-    verify_graph
+    verify_graph,
+    get_plain_string_field_flags,
+    get_string_field_flags
 )
 from app.models.graph_template_validation_status import GraphTemplateValidationStatus
 from app.models.db.graph_template_model import NodeTemplate
@@ -42,7 +46,7 @@ class TestVerifyNodeExists:
         
         registered_nodes = [mock_node1, mock_node2]
         
-        errors = await verify_node_exists(graph_template, registered_nodes) # type: ignore
+        errors = verify_node_exists(graph_template, registered_nodes) # type: ignore
         
         assert len(errors) == 0
 
@@ -66,7 +70,7 @@ class TestVerifyNodeExists:
         
         registered_nodes = [mock_node1]
         
-        errors = await verify_node_exists(graph_template, registered_nodes) # type: ignore
+        errors = verify_node_exists(graph_template, registered_nodes) # type: ignore
         
         assert len(errors) == 1
         assert "Node missing_node in namespace test does not exist" in errors[0]
@@ -82,7 +86,7 @@ class TestVerifyNodeExists:
         
         registered_nodes = []
         
-        errors = await verify_node_exists(graph_template, registered_nodes) # type: ignore
+        errors = verify_node_exists(graph_template, registered_nodes) # type: ignore
         
         assert len(errors) == 2
         assert any("Node missing1 in namespace test does not exist" in error for error in errors)
@@ -118,7 +122,7 @@ class TestVerifySecrets:
         
         registered_nodes = [mock_node1, mock_node2]
         
-        errors = await verify_secrets(graph_template, registered_nodes) # type: ignore
+        errors = verify_secrets(graph_template, registered_nodes) # type: ignore
         
         assert len(errors) == 0
 
@@ -139,7 +143,7 @@ class TestVerifySecrets:
         
         registered_nodes = [mock_node1]
         
-        errors = await verify_secrets(graph_template, registered_nodes) # type: ignore
+        errors = verify_secrets(graph_template, registered_nodes) # type: ignore
         
         assert len(errors) == 1
         assert "Secret missing_secret is required but not present in the graph template" in errors[0]
@@ -161,7 +165,7 @@ class TestVerifySecrets:
         
         registered_nodes = [mock_node1]
         
-        errors = await verify_secrets(graph_template, registered_nodes) # type: ignore
+        errors = verify_secrets(graph_template, registered_nodes) # type: ignore
         
         assert len(errors) == 0
 
@@ -182,7 +186,7 @@ class TestVerifySecrets:
         
         registered_nodes = [mock_node1]
         
-        errors = await verify_secrets(graph_template, registered_nodes) # type: ignore
+        errors = verify_secrets(graph_template, registered_nodes) # type: ignore
         
         assert len(errors) == 2
         assert any("Secret secret1 is required but not present" in error for error in errors)
@@ -232,7 +236,7 @@ class TestVerifyInputs:
             mock_output_model.model_fields = {"field1": MagicMock(annotation=str)}
             mock_create_model.side_effect = [mock_input_model, mock_output_model]
             
-            errors = await verify_inputs(graph_template, registered_nodes) # type: ignore
+            errors = verify_inputs(graph_template, registered_nodes) # type: ignore
             
         assert len(errors) == 0
 
@@ -268,7 +272,7 @@ class TestVerifyInputs:
             mock_input_model.model_fields = {"input1": MagicMock(annotation=str)}
             mock_create_model.return_value = mock_input_model
             
-            errors = await verify_inputs(graph_template, registered_nodes) # type: ignore
+            errors = verify_inputs(graph_template, registered_nodes) # type: ignore
             
         assert len(errors) == 1
         assert "Input input1 in node node1 in namespace test is not present in the graph template" in errors[0]
@@ -305,7 +309,7 @@ class TestVerifyInputs:
             mock_input_model.model_fields = {"input1": MagicMock(annotation=int)}
             mock_create_model.return_value = mock_input_model
             
-            errors = await verify_inputs(graph_template, registered_nodes) # type: ignore
+            errors = verify_inputs(graph_template, registered_nodes) # type: ignore
             
         assert len(errors) == 1
         assert "Input input1 in node node1 in namespace test is not a string" in errors[0]
@@ -348,7 +352,7 @@ class TestVerifyInputs:
             # The function should raise an AssertionError when get_node_by_identifier returns None
             # Since we can't change the code, we'll catch the AssertionError and verify it's the expected one
             try:
-                errors = await verify_inputs(graph_template, registered_nodes) # type: ignore
+                errors = verify_inputs(graph_template, registered_nodes) # type: ignore
                 # If no AssertionError is raised, that's also acceptable
                 assert isinstance(errors, list)
             except AssertionError:
@@ -367,7 +371,7 @@ class TestVerifyGraph:
             NodeTemplate(node_name="node1", identifier="id1", namespace="test", inputs={}, next_nodes=None, unites=None)
         ]
         graph_template.secrets = {}
-        graph_template.save = AsyncMock()
+        graph_template.set = AsyncMock()
         
         mock_node1 = MagicMock()
         mock_node1.node_name = "node1"
@@ -391,9 +395,11 @@ class TestVerifyGraph:
                         
                         await verify_graph(graph_template)
                         
-                        assert graph_template.validation_status == GraphTemplateValidationStatus.VALID
-                        assert graph_template.validation_errors == []
-                        graph_template.save.assert_called_once()
+                        graph_template.set.assert_called_once()
+                        update = graph_template.set.call_args[0][0]
+                        assert update["validation_status"] == GraphTemplateValidationStatus.VALID
+                        assert update["validation_errors"] == []
+                        assert "updated_at" in update
 
     @pytest.mark.asyncio
     async def test_verify_graph_with_errors(self):
@@ -403,7 +409,7 @@ class TestVerifyGraph:
             NodeTemplate(node_name="node1", identifier="id1", namespace="test", inputs={}, next_nodes=None, unites=None)
         ]
         graph_template.secrets = {}
-        graph_template.save = AsyncMock()
+        graph_template.set = AsyncMock()
         
         mock_node1 = MagicMock()
         mock_node1.node_name = "node1"
@@ -427,9 +433,10 @@ class TestVerifyGraph:
                         
                         await verify_graph(graph_template)
                         
-                        assert graph_template.validation_status == GraphTemplateValidationStatus.INVALID
-                        assert graph_template.validation_errors == ["Node error", "Secret error", "Input error"]
-                        graph_template.save.assert_called_once()
+                        graph_template.set.assert_called_once()
+                        update = graph_template.set.call_args[0][0]
+                        assert update["validation_status"] == GraphTemplateValidationStatus.INVALID
+                        assert update["validation_errors"] == ["Node error", "Secret error", "Input error"]
 
     @pytest.mark.asyncio
     async def test_verify_graph_exception(self):
@@ -443,14 +450,63 @@ class TestVerifyGraph:
         with patch('app.tasks.verify_graph.RegisteredNode.list_nodes_by_templates') as mock_list_nodes:
             mock_list_nodes.side_effect = Exception("Database error")
             
-            # Mock the save method to be async
-            graph_template.save = AsyncMock()
+            # Mock the set method to be async
+            graph_template.set = AsyncMock()
             
             await verify_graph(graph_template)
             
-            assert graph_template.validation_status == GraphTemplateValidationStatus.INVALID
-            assert graph_template.validation_errors == ["Validation failed due to unexpected error: Database error"]
-            graph_template.save.assert_called_once() 
+            graph_template.set.assert_called_once()
+            update = graph_template.set.call_args[0][0]
+            assert update["validation_status"] == GraphTemplateValidationStatus.INVALID
+            assert update["validation_errors"] == ["Validation failed due to unexpected error: Database error"]
+
+    @pytest.mark.asyncio
+    async def test_verify_graph_write_failure_is_logged_and_marked_invalid(self):
+        """Test a failed validation write is logged and the graph is marked invalid"""
+        graph_template = MagicMock()
+        graph_template.nodes = []
+        graph_template.secrets = {}
+        graph_template.set = AsyncMock(side_effect=[Exception("Write error"), None])
+
+        with patch('app.tasks.verify_graph.RegisteredNode.list_nodes_by_templates', new_callable=AsyncMock) as mock_list_nodes, \
+             patch('app.tasks.verify_graph.logger') as mock_logger:
+            mock_list_nodes.return_value = []
+
+            await verify_graph(graph_template)
+
+        mock_logger.error.assert_called_once()
+        assert graph_template.set.call_count == 2
+        update = graph_template.set.call_args[0][0]
+        assert update["validation_status"] == GraphTemplateValidationStatus.INVALID
+        assert update["validation_errors"] == ["Validation failed due to unexpected error: Write error"]
+        assert "updated_at" in update
+
+    @pytest.mark.asyncio
+    async def test_verify_graph_runs_verify_inputs_off_event_loop(self):
+        """Test verify_inputs is run in a worker thread instead of the event loop thread"""
+        graph_template = MagicMock()
+        graph_template.nodes = []
+        graph_template.secrets = {}
+        graph_template.set = AsyncMock()
+
+        event_loop_thread = threading.get_ident()
+        verify_inputs_threads = []
+
+        def record_thread(*args, **kwargs):
+            verify_inputs_threads.append(threading.get_ident())
+            return []
+
+        with patch('app.tasks.verify_graph.RegisteredNode.list_nodes_by_templates', new_callable=AsyncMock) as mock_list_nodes, \
+             patch('app.tasks.verify_graph.verify_node_exists', return_value=[]), \
+             patch('app.tasks.verify_graph.verify_secrets', return_value=[]), \
+             patch('app.tasks.verify_graph.verify_inputs', side_effect=record_thread):
+            mock_list_nodes.return_value = []
+
+            await verify_graph(graph_template)
+
+        assert len(verify_inputs_threads) == 1
+        assert verify_inputs_threads[0] != event_loop_thread
+        assert graph_template.set.call_args[0][0]["validation_status"] == GraphTemplateValidationStatus.VALID
 
 
 @pytest.mark.asyncio
@@ -459,7 +515,7 @@ async def test_verify_graph_with_exception():
     graph_template = MagicMock()
     graph_template.nodes = []
     graph_template.id = "test_id"
-    graph_template.save = AsyncMock()
+    graph_template.set = AsyncMock()
     graph_template.validation_status = MagicMock()
     graph_template.validation_errors = MagicMock()
 
@@ -473,9 +529,10 @@ async def test_verify_graph_with_exception():
         await verify_graph(graph_template)
 
         # Verify that the graph was marked as invalid with error
-        assert graph_template.validation_status == GraphTemplateValidationStatus.INVALID
-        assert "Validation failed due to unexpected error: Database connection error" in graph_template.validation_errors
-        graph_template.save.assert_called()
+        graph_template.set.assert_called_once()
+        update = graph_template.set.call_args[0][0]
+        assert update["validation_status"] == GraphTemplateValidationStatus.INVALID
+        assert "Validation failed due to unexpected error: Database connection error" in update["validation_errors"]
 
 
 @pytest.mark.asyncio
@@ -484,7 +541,7 @@ async def test_verify_graph_with_validation_errors():
     graph_template = MagicMock()
     graph_template.nodes = []
     graph_template.id = "test_id"
-    graph_template.save = AsyncMock()
+    graph_template.set = AsyncMock()
     graph_template.validation_status = MagicMock()
     graph_template.validation_errors = MagicMock()
 
@@ -498,9 +555,10 @@ async def test_verify_graph_with_validation_errors():
         await verify_graph(graph_template)
 
         # Verify that the graph was marked as invalid
-        assert graph_template.validation_status == GraphTemplateValidationStatus.INVALID
+        update = graph_template.set.call_args[0][0]
+        assert update["validation_status"] == GraphTemplateValidationStatus.INVALID
         # The specific error message depends on the actual validation logic
-        assert len(graph_template.validation_errors) > 0
+        assert len(update["validation_errors"]) > 0
 
 
 @pytest.mark.asyncio
@@ -509,7 +567,7 @@ async def test_verify_graph_with_valid_graph():
     graph_template = MagicMock()
     graph_template.nodes = []
     graph_template.id = "test_id"
-    graph_template.save = AsyncMock()
+    graph_template.set = AsyncMock()
     graph_template.validation_status = MagicMock()
     graph_template.validation_errors = MagicMock()
 
@@ -532,7 +590,7 @@ async def test_verify_graph_with_valid_graph():
 
         # Verify that the graph was processed (status may vary based on actual validation)
         # The specific status depends on the actual validation logic
-        assert graph_template.save.called
+        assert graph_template.set.called
 
 
 
@@ -549,7 +607,7 @@ async def test_verify_secrets_with_none_secrets():
 
     registered_nodes = [mock_node]
 
-    errors = await verify_secrets(graph_template, registered_nodes) # type: ignore
+    errors = verify_secrets(graph_template, registered_nodes) # type: ignore
 
     # Should return no errors when secrets is None
     assert len(errors) == 0
@@ -566,7 +624,7 @@ async def test_verify_secrets_with_empty_secrets():
 
     registered_nodes = [mock_node]
 
-    errors = await verify_secrets(graph_template, registered_nodes) # type: ignore
+    errors = verify_secrets(graph_template, registered_nodes) # type: ignore
 
     # Should return no errors when secrets list is empty
     assert len(errors) == 0
@@ -591,7 +649,7 @@ async def test_verify_inputs_with_node_without_inputs():
 
     registered_nodes = [mock_node]
 
-    errors = await verify_inputs(graph_template, registered_nodes) # type: ignore
+    errors = verify_inputs(graph_template, registered_nodes) # type: ignore
 
     # Node without inputs should be skipped
     assert len(errors) == 0
@@ -629,12 +687,112 @@ async def test_verify_inputs_with_store_dependent():
         mock_dependent_string.get_identifier_field.return_value = [("store", "key")]
         mock_node.get_dependent_strings.return_value = [mock_dependent_string]
 
-        errors = await verify_inputs(graph_template, registered_nodes) # type: ignore
+        errors = verify_inputs(graph_template, registered_nodes) # type: ignore
 
         # Store dependencies should be skipped, so no errors
         assert len(errors) == 0
 
 
+@pytest.mark.asyncio
+async def test_verify_inputs_reuses_models_for_shared_registered_node():
+    """Test verify_inputs builds each registered node's models only once"""
+    graph_template = MagicMock()
+    graph_template.nodes = [
+        NodeTemplate(node_name="test_node", identifier="id1", namespace="test", inputs={"input1": "value1"}, next_nodes=["id2"], unites=None),
+        NodeTemplate(node_name="test_node", identifier="id2", namespace="test", inputs={"input1": "${{id1.outputs.output1}}"}, next_nodes=None, unites=None)
+    ]
+    graph_template.get_node_by_identifier.return_value = graph_template.nodes[0]
+
+    mock_node = MagicMock()
+    mock_node.name = "test_node"
+    mock_node.namespace = "test"
+    mock_node.inputs_schema = {}
+    mock_node.outputs_schema = {}
+    mock_node.secrets = []
+
+    registered_nodes = [mock_node]
+
+    with patch('app.tasks.verify_graph.create_model') as mock_create_model:
+        mock_field = MagicMock()
+        mock_field.annotation = str
+        mock_input_model = MagicMock()
+        mock_input_model.model_fields = {"input1": mock_field}
+        mock_output_model = MagicMock()
+        mock_output_model.model_fields = {"output1": mock_field}
+        mock_create_model.side_effect = [mock_input_model, mock_output_model]
+
+        errors = verify_inputs(graph_template, registered_nodes) # type: ignore
+
+        assert errors == []
+        # One inputs model and one outputs model for the shared registered node
+        assert mock_create_model.call_count == 2
+
+
+
+@pytest.mark.asyncio
+async def test_verify_inputs_reuses_models_for_identical_schemas():
+    """Test verify_inputs builds one model for distinct registered nodes sharing a schema"""
+    graph_template = MagicMock()
+    graph_template.nodes = [
+        NodeTemplate(node_name="node_a", identifier="id1", namespace="test", inputs={"input1": "value1"}, next_nodes=None, unites=None),
+        NodeTemplate(node_name="node_b", identifier="id2", namespace="test", inputs={"input1": "value2"}, next_nodes=None, unites=None)
+    ]
+
+    registered_nodes = []
+    for name in ["node_a", "node_b"]:
+        mock_node = MagicMock()
+        mock_node.name = name
+        mock_node.namespace = "test"
+        # Equal schemas loaded as separate dicts, with keys in a different order
+        mock_node.inputs_schema = {"type": "object", "$defs": {}} if name == "node_a" else {"$defs": {}, "type": "object"}
+        mock_node.outputs_schema = {}
+        mock_node.secrets = []
+        registered_nodes.append(mock_node)
+
+    with patch('app.tasks.verify_graph.create_model') as mock_create_model:
+        mock_field = MagicMock()
+        mock_field.annotation = str
+        mock_input_model = MagicMock()
+        mock_input_model.model_fields = {"input1": mock_field}
+        mock_create_model.return_value = mock_input_model
+
+        errors = verify_inputs(graph_template, registered_nodes) # type: ignore
+
+        assert errors == []
+        mock_create_model.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_verify_inputs_serializes_each_registered_node_schema_once():
+    """Test verify_inputs builds the schema cache key once per registered node, not once per reference"""
+    parent_template = NodeTemplate(node_name="parent_node", identifier="parent", namespace="test", inputs={}, next_nodes=["child1", "child2"], unites=None)
+    child_inputs = {"input1": "${{parent.outputs.output1}}", "input2": "${{parent.outputs.output1}}"}
+    graph_template = MagicMock()
+    graph_template.nodes = [
+        parent_template,
+        NodeTemplate(node_name="child_node", identifier="child1", namespace="test", inputs=child_inputs, next_nodes=None, unites=None),
+        NodeTemplate(node_name="child_node", identifier="child2", namespace="test", inputs=child_inputs, next_nodes=None, unites=None)
+    ]
+    graph_template.get_node_by_identifier.return_value = parent_template
+
+    mock_parent = MagicMock()
+    mock_parent.name = "parent_node"
+    mock_parent.namespace = "test"
+    mock_parent.inputs_schema = {}
+    mock_parent.outputs_schema = {"type": "object", "properties": {"output1": {"type": "string"}}, "required": ["output1"]}
+
+    mock_child = MagicMock()
+    mock_child.name = "child_node"
+    mock_child.namespace = "test"
+    mock_child.inputs_schema = {"type": "object", "properties": {"input1": {"type": "string"}, "input2": {"type": "string"}}, "required": ["input1", "input2"]}
+    mock_child.outputs_schema = {}
+
+    with patch('app.tasks.verify_graph.json.dumps', wraps=json.dumps) as mock_dumps:
+        errors = verify_inputs(graph_template, [mock_parent, mock_child]) # type: ignore
+
+    assert errors == []
+    # Parent inputs, child inputs and parent outputs, despite four references to the parent's outputs
+    assert mock_dumps.call_count == 3
+
 @pytest.mark.asyncio
 async def test_verify_inputs_with_missing_input_in_template():
     """Test verify_inputs when input is not present in graph template"""
@@ -662,7 +820,7 @@ async def test_verify_inputs_with_missing_input_in_template():
         mock_input_model.model_fields = {"input1": mock_field, "input2": mock_field}  # input2 not in template
         mock_create_model.return_value = mock_input_model
 
-        errors = await verify_inputs(graph_template, registered_nodes) # type: ignore
+        errors = verify_inputs(graph_template, registered_nodes) # type: ignore
 
         # Should have error for missing input2
         assert len(errors) == 1
@@ -696,7 +854,7 @@ async def test_verify_inputs_with_non_string_input():
         mock_input_model.model_fields = {"input1": mock_field}
         mock_create_model.return_value = mock_input_model
 
-        errors = await verify_inputs(graph_template, registered_nodes) # type: ignore
+        errors = verify_inputs(graph_template, registered_nodes) # type: ignore
 
         # Should have error for non-string input
         assert len(errors) == 1
@@ -743,7 +901,7 @@ async def test_verify_inputs_with_missing_dependent_node():
         # Mock missing node
         graph_template.get_node_by_identifier.return_value = None
 
-        errors = await verify_inputs(graph_template, registered_nodes) # type: ignore
+        errors = verify_inputs(graph_template, registered_nodes) # type: ignore
 
         assert len(errors) == 1
         assert "Node missing does not exist in the graph template" in errors[0]
@@ -799,7 +957,7 @@ async def test_verify_inputs_with_missing_dependent_registered_node():
         mock_output_model.model_fields = {"output1": mock_output_field}
         mock_create_model.side_effect = [mock_input_model, mock_output_model]
 
-        errors = await verify_inputs(graph_template, registered_nodes) # type: ignore
+        errors = verify_inputs(graph_template, registered_nodes) # type: ignore
 
         assert len(errors) == 1
         assert "Node parent_node in namespace other_namespace does not exist" in errors[0]
@@ -863,7 +1021,7 @@ async def test_verify_inputs_with_missing_output_field():
         with patch('app.tasks.verify_graph.RegisteredNode') as mock_registered_node_cls:
             mock_registered_node_cls.list_nodes_by_templates.return_value = registered_nodes + [mock_parent_registered_node]
 
-            errors = await verify_inputs(graph_template, registered_nodes + [mock_parent_registered_node]) # type: ignore
+            errors = verify_inputs(graph_template, registered_nodes + [mock_parent_registered_node]) # type: ignore
 
             assert len(errors) == 1
             assert "Field output1 in node parent_node in namespace test does not exist" in errors[0]
@@ -929,7 +1087,66 @@ async def test_verify_inputs_with_non_string_output_field():
         with patch('app.tasks.verify_graph.RegisteredNode') as mock_registered_node_cls:
             mock_registered_node_cls.list_nodes_by_templates.return_value = registered_nodes + [mock_parent_registered_node]
 
-            errors = await verify_inputs(graph_template, registered_nodes + [mock_parent_registered_node]) # type: ignore
+            errors = verify_inputs(graph_template, registered_nodes + [mock_parent_registered_node]) # type: ignore
 
             assert len(errors) == 1
-            assert "Field output1 in node parent_node in namespace test is not a string" in errors[0] 
\ No newline at end of file
+            assert "Field output1 in node parent_node in namespace test is not a string" in errors[0] 
+
+
+def test_get_string_field_flags():
+    """Test get_string_field_flags marks only plain string fields"""
+    schema = {
+        "type": "object",
+        "properties": {
+            "name": {"type": "string"},
+            "count": {"type": "integer"},
+            "choice": {"type": "string", "enum": ["a", "b"]}
+        },
+        "required": ["name", "count", "choice"]
+    }
+
+    assert get_string_field_flags(schema) == {"name": True, "count": False, "choice": False}
+
+
+def test_get_string_field_flags_plain_schema_skips_create_model():
+    """Test flat scalar schemas are read directly without building a model"""
+    schema = {
+        "title": "Inputs",
+        "type": "object",
+        "properties": {
+            "name": {"title": "Name", "type": "string", "minLength": 1},
+            "count": {"title": "Count", "type": "integer", "default": 3}
+        },
+        "required": ["name"]
+    }
+
+    with patch('app.tasks.verify_graph.create_model') as mock_create_model:
+        assert get_string_field_flags(schema) == {"name": True, "count": False}
+        mock_create_model.assert_not_called()
+
+
+def test_get_string_field_flags_formatted_string_uses_create_model():
+    """Test properties whose keywords change the Python type fall back to create_model"""
+    schema = {
+        "type": "object",
+        "properties": {
+            "when": {"type": "string", "format": "date-time"}
+        },
+        "required": ["when"]
+    }
+
+    assert get_string_field_flags(schema) == {"when": False}
+
+
+def test_get_string_field_flags_list_type_uses_create_model():
+    """Test a list-valued type such as a nullable string falls back to create_model"""
+    schema = {
+        "type": "object",
+        "properties": {
+            "name": {"type": ["string", "null"]}
+        },
+        "required": ["name"]
+    }
+
+    assert get_plain_string_field_flags(schema) is None
+    assert get_string_field_flags(schema) == {"name": False}
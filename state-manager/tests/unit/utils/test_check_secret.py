@@ -152,6 +152,23 @@ class TestCheckApiKey:
         result = await check_api_key(long_key)
         assert result == long_key
 
+    @patch.dict(os.environ, {'STATE_MANAGER_SECRET': 'cached-key'})
+    @pytest.mark.asyncio
+    async def test_check_api_key_loads_settings_once(self):
+        """Test check_api_key reads the secret from settings only on the first call"""
+        import importlib
+        import app.utils.check_secret
+        importlib.reload(app.utils.check_secret)
+        from app.utils.check_secret import check_api_key
+
+        with patch('app.utils.check_secret.get_settings', wraps=app.utils.check_secret.get_settings) as mock_get_settings:
+            assert await check_api_key('cached-key') == 'cached-key'
+            with pytest.raises(HTTPException):
+                await check_api_key('wrong-key')
+            assert await check_api_key('cached-key') == 'cached-key'
+
+            mock_get_settings.assert_called_once()
+
 
 class TestModuleConstants:
     """Test cases for module constants and configuration"""
@@ -1,5 +1,7 @@
 import os
 import base64
+import threading
+import time
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -189,4 +191,23 @@ class TestGetEncrypter:
         # Encrypter constructor should be called only once
         assert mock_encrypter_class.call_count == 1
         # All calls should return the same instance
-        assert result1 is result2 is result3 is mock_instance
\ No newline at end of file
+        assert result1 is result2 is result3 is mock_instance
+
+    @patch('app.utils.encrypter.Encrypter')
+    def test_get_encrypter_concurrent_first_calls_create_one_instance(self, mock_encrypter_class):
+        """Test that concurrent first calls to get_encrypter share a single instance"""
+        def slow_constructor():
+            time.sleep(0.01)
+            return MagicMock()
+
+        mock_encrypter_class.side_effect = slow_constructor
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(get_encrypter())) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert mock_encrypter_class.call_count == 1
+        assert all(result is results[0] for result in results)